@@ -8,40 +8,52 @@ __all__ = ["__version__"]
 try:
     from .main import (
         ALLOWED_SUFFIXES,
+        COMBINED_PATTERN,
         DEST_PATTERN,
         IMG_FORMATS,
         MAX_WORKERS,
+        MOV_CONVERT_WORKERS,
         PATTERNS_TO_RENAME,
+        SUFFIX_RE,
         VIDEO_FORMATS,
         FileMetadata,
         ProcessingStats,
         _extract_single_file_metadata,
         collect_file_metadata,
+        convert_and_rename,
         convert_files,
+        convert_heic_batch,
         convert_heic_to_jpg,
         convert_mov_to_mp4,
+        convert_movs_to_mp4_batch,
         extract_exif_timestamp,
         extract_video_timestamp,
+        extract_video_timestamps_batch,
         fallback_timestamp,
         get_media_created_date_time,
+        load_skip_cache,
         log_summary,
         main,
         parse_filename_date,
         process_folder,
         rename_file,
         rename_files,
+        save_skip_cache,
         setup_logger,
         should_skip_file,
     )
     # Add successfully imported items to __all__
     __all__.extend([
-        "ALLOWED_SUFFIXES", "DEST_PATTERN", "IMG_FORMATS", "MAX_WORKERS",
-        "PATTERNS_TO_RENAME", "VIDEO_FORMATS", "FileMetadata", "ProcessingStats",
-        "_extract_single_file_metadata", "collect_file_metadata", "convert_files",
-        "convert_heic_to_jpg", "convert_mov_to_mp4", "extract_exif_timestamp",
-        "extract_video_timestamp", "fallback_timestamp", "get_media_created_date_time",
-        "log_summary", "main", "parse_filename_date", "process_folder",
-        "rename_file", "rename_files", "setup_logger", "should_skip_file",
+        "ALLOWED_SUFFIXES", "COMBINED_PATTERN", "DEST_PATTERN", "IMG_FORMATS", "MAX_WORKERS",
+        "MOV_CONVERT_WORKERS", "PATTERNS_TO_RENAME", "SUFFIX_RE", "VIDEO_FORMATS",
+        "FileMetadata", "ProcessingStats",
+        "_extract_single_file_metadata", "collect_file_metadata", "convert_and_rename",
+        "convert_files", "convert_heic_batch", "convert_heic_to_jpg", "convert_mov_to_mp4",
+        "convert_movs_to_mp4_batch", "extract_exif_timestamp", "extract_video_timestamp",
+        "extract_video_timestamps_batch", "fallback_timestamp", "get_media_created_date_time",
+        "load_skip_cache", "log_summary", "main", "parse_filename_date",
+        "process_folder", "rename_file", "rename_files", "save_skip_cache",
+        "setup_logger", "should_skip_file",
     ])
 except ImportError as e:  # pragma: no cover
     # If imports fail (e.g., missing dependencies), at least expose __version__
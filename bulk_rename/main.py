@@ -19,25 +19,35 @@ Dependencies:
     - pywin32 (for win32com.propsys)
     - send2trash (for deleting files using the recycle bin, so recovery is possible)
     - ImageMagick (for .heic conversion, must be installed and in PATH)
+    - pillow-heif (optional, converts .heic in-process instead of through ImageMagick)
+    - exiftool (optional, batches video metadata reads when propsys is unavailable)
+    - orjson (optional, faster parsing of ffprobe and exiftool JSON output)
 """
+# pylint: disable=too-many-lines
 
 from __future__ import annotations
 
 import argparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
+from datetime import date, datetime, timezone, timedelta
+import ctypes
+import functools
 import logging
 import json
-import mimetypes
 import os
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
 from pathlib import Path
 import re
+import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
 from timeit import default_timer as timer
 from typing import Optional, Tuple
+import weakref
 
 from PIL import Image, UnidentifiedImageError
 from send2trash import send2trash
@@ -59,21 +69,96 @@ except ImportError:  # pragma: no cover
     pythoncom = None  # pragma: no cover
     WINDOWS_AVAILABLE = False  # pragma: no cover
 
+# Optional HEIF plugin for Pillow; without it HEIC files are converted by ImageMagick
+try:
+    import pillow_heif  # type: ignore
+    # The heif extra is not installed in CI, so the plugin is exercised via HEIF_AVAILABLE mocks
+    pillow_heif.register_heif_opener()  # pragma: no cover
+    HEIF_AVAILABLE = True  # pragma: no cover
+except ImportError:  # pragma: no cover
+    HEIF_AVAILABLE = False  # pragma: no cover
+
+# Optional faster JSON parser for ffprobe/exiftool output; both accept bytes
+try:
+    from orjson import loads as _json_loads  # type: ignore  # pylint: disable=no-name-in-module
+except ImportError:  # pragma: no cover
+    _json_loads = json.loads  # pragma: no cover
+
+# JPEG quality for in-process HEIC conversion
+_HEIC_JPEG_QUALITY = 92
+
+# Windows property keys holding a capture date, in priority order. PKEY_DateCreated
+# is left out: it is the filesystem creation time, not media metadata.
+_PROPSYS_DATE_KEYS = ('PKEY_Media_DateEncoded', 'PKEY_Photo_DateTaken')
+
+# Per-thread COM state; see _ensure_com_initialized
+_com_state = threading.local()
+
 # File format constants - frozensets for O(1) lookup
 IMG_FORMATS = frozenset({'.png', '.jpg', '.jpeg', '.heic'})
 VIDEO_FORMATS = frozenset({'.m4v', '.mov', '.mp4'})
 ALLOWED_SUFFIXES = IMG_FORMATS | VIDEO_FORMATS
+# Case-insensitive match of an allowed suffix at the end of a name; cheaper than
+# splitting off and lowercasing the suffix for every directory entry
+SUFFIX_RE = re.compile('(?:' + '|'.join(map(re.escape, sorted(ALLOWED_SUFFIXES))) + r')\Z',
+                       re.I)
+
+# Expected MIME type per image suffix, for diagnostics (avoids loading the mimetypes DB)
+_EXT_MIME = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.heic': 'image/heic',
+}
+
+# Log records buffered per file write when setup_logger runs in bulk mode
+_BULK_LOG_CAPACITY = 1024
+
+# Shared tzinfo for the positional datetime() calls on per-file paths
+_UTC = timezone.utc
 
 # Default number of worker threads for parallel metadata extraction
 MAX_WORKERS = 8
 
+# ffmpeg output options for MOV -> MP4 (H.264/AAC, playable everywhere)
+_MP4_ENCODE_ARGS = ('-c:v', 'libx264', '-preset', 'fast', '-pix_fmt', 'yuv420p',
+                    '-c:a', 'aac', '-movflags', '+faststart')
+# Smaller outputs are treated as failed conversions
+_MIN_MP4_BYTES = 100000
+# Inputs per ffmpeg process in convert_movs_to_mp4_batch; each is encoded concurrently
+_MOV_BATCH_SIZE = 4
+
+# Concurrent ffmpeg processes (one batch each) for MOV conversion; x264 already uses
+# every core, so a few processes are enough to overlap one batch's startup and I/O
+# with another's encode
+MOV_CONVERT_WORKERS = 2
+
+# EXIF header parsing: tags and how much of each image file to read
+_DATETIME_ORIGINAL_TAG = 36867  # DateTimeOriginal
+_DATETIME_TAG = 306             # DateTime
+_EXIF_IFD_POINTER = 34665       # ExifIFD
+_EXIF_HEADER = b'Exif\x00\x00'
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_EXIF_SCAN_BYTES = 128 * 1024  # room for an ICC profile or thumbnail ahead of the EXIF block
+
+# Linux statx(2): request only the mtime and allow cached attributes
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MTIME = 0x40
+_STATX_BUF_SIZE = 256       # sizeof(struct statx)
+_STATX_MTIME_OFFSET = 112   # offsetof(struct statx, stx_mtime)
+
+
+# __slots__ drop the per-instance __dict__; dataclass(slots=...) needs Python 3.10
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FileMetadata:  # pylint: disable=too-many-instance-attributes
     """Metadata for a media file being processed."""
     original_path: Path
     timestamp: datetime
-    extension: str
+    extension: str  # lowercased suffix, e.g. '.jpg'
     original_name: str
     metadata_reliable: bool
     timestamp_source: str
@@ -81,7 +166,7 @@ class FileMetadata:  # pylint: disable=too-many-instance-attributes
     skip_reason: Optional[str] = None  # None=not skipped, 'pattern', 'already_renamed'
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProcessingStats:
     """Statistics from processing a folder of media files."""
     heic_count: int = 0
@@ -92,12 +177,17 @@ class ProcessingStats:
     elapsed: timedelta = field(default_factory=timedelta)
 
 
-def setup_logger(script_name: str, verbose: bool = False) -> logging.Logger:
+def setup_logger(script_name: str, verbose: bool = False, bulk: bool = False) -> logging.Logger:
     """Configures and returns a logger for the script.
 
     Args:
         script_name (str): Name of the script for log file naming.
         verbose (bool): If True, set log level to DEBUG; otherwise INFO.
+        bulk (bool): If True, buffer log file writes (flushed every
+            ``_BULK_LOG_CAPACITY`` records, on errors, and at exit), so very
+            large folders are not slowed down by per-file log writes. The
+            console still shows INFO output such as dry-run actions and the
+            summary.
 
     Returns:
         logging.Logger: Configured logger instance.
@@ -110,11 +200,17 @@ def setup_logger(script_name: str, verbose: bool = False) -> logging.Logger:
         f"{script_name}.log", when="d", backupCount=10, encoding="utf-8"
     )
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
+    if bulk:
+        logger.addHandler(MemoryHandler(_BULK_LOG_CAPACITY, flushLevel=logging.ERROR,
+                                        target=file_handler))
+    else:
+        logger.addHandler(file_handler)
     logger.addHandler(console_handler)
     logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    # Records are fully handled here; don't hand them to root handlers as well
+    logger.propagate = False
     return logger
 
 def rename_file(src_path: Path,
@@ -132,110 +228,388 @@ def rename_file(src_path: Path,
     Returns:
         bool: True if rename was successful, False otherwise.
     """
+    src_name = src_path.name
+    dst_name = dst_path.name
     if src_path == dst_path:
-        logger.info(
-            "Skipping rename: source and destination are the same (%s)", src_path.name
-        )
+        logger.info("Skipping rename: source and destination are the same (%s)", src_name)
         return False
 
-    logger.info("Renaming %s to %s", src_path.name, dst_path.name)
+    logger.info("Renaming %s to %s", src_name, dst_name)
     if commit:
         try:
-            src_path.rename(dst_path)
-            logger.info("Rename successful: %s -> %s", src_path.name, dst_path.name)
+            # os.rename skips the Path object pathlib builds for its return value
+            os.rename(src_path, dst_path)
+            logger.info("Rename successful: %s -> %s", src_name, dst_name)
             return True
         except OSError as e:
-            logger.error("Rename failed for %s: %s", src_path.name, e)
+            logger.error("Rename failed for %s: %s", src_name, e)
             return False
     else:
-        logger.info("Would rename %s to %s", src_path.name, dst_path.name)
+        logger.info("Would rename %s to %s", src_name, dst_name)
         return True
 
+@functools.cache
+def _libc_statx():
+    """Returns libc's statx function, or None where it is unavailable."""
+    if not sys.platform.startswith('linux'):
+        return None
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):  # glibc < 2.28 or non-glibc libc
+        return None
+    statx.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int,
+                      ctypes.c_uint, ctypes.c_void_p)
+    statx.restype = ctypes.c_int
+    return statx
+
+# On Windows os.scandir returns full stat data with each entry; elsewhere
+# DirEntry.stat() is a separate stat call
+_SCANDIR_CACHES_STAT = os.name == 'nt'
+
+def _fast_stat_mtime(path: Path) -> float:
+    """Returns a file's modification time using the cheapest available call.
+
+    On Linux this uses statx with AT_STATX_DONT_SYNC and only STATX_MTIME
+    requested, so network filesystems may answer from cache. Elsewhere (and if
+    statx fails) it falls back to os.stat, which raises the usual OSError.
+
+    Args:
+        path (Path): Path to the file.
+
+    Returns:
+        float: Modification time in seconds since the epoch.
+    """
+    statx = _libc_statx()
+    if statx is not None:
+        buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+        if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_MTIME, buf) == 0:
+            (mask,) = struct.unpack_from('=I', buf.raw, 0)
+            if mask & _STATX_MTIME:
+                sec, nsec = struct.unpack_from('=qI', buf.raw, _STATX_MTIME_OFFSET)
+                return sec + nsec / 1e9
+    return os.stat(path).st_mtime
+
 def fallback_timestamp(path: Path,
-                       logger: logging.Logger) -> datetime:
+                       logger: logging.Logger,
+                       mtime: Optional[float] = None) -> datetime:
     """Returns the file's last modified timestamp as a fallback.
 
     Args:
         path (Path): Path to the file.
+        mtime (Optional[float]): Modification time already read from the
+            directory scan; the file is only stat'ed when this is None.
 
     Returns:
         datetime: The file's modification time.
     """
-
-    local_timestamp = datetime.fromtimestamp(path.stat().st_mtime)
-    fallback_utc = local_timestamp.astimezone(timezone.utc)
-    logger.debug("%s fallback timestamp used: %s",
-                 path.name,
-                 fallback_utc.isoformat())
+    if mtime is None:
+        mtime = _fast_stat_mtime(path)
+    # Converting straight to UTC skips the naive local-time round trip
+    fallback_utc = datetime.fromtimestamp(mtime, _UTC)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s fallback timestamp used: %s",
+                     path.name,
+                     fallback_utc.isoformat())
     return fallback_utc
 
-def extract_exif_timestamp(image_path: Path,
-                           logger: logging.Logger) -> Tuple[Optional[datetime], str]:
-    """Extracts the original capture timestamp from an image's EXIF metadata,
-    normalized to UTC. Falls back to filename-based timestamp if EXIF is unreadable.
+def _tiff_ascii_value(tiff: bytes,
+                      entries: dict[int, tuple[int, int, int]],
+                      tag: int) -> Optional[str]:
+    """Return an ASCII tag value from a parsed IFD, or None if absent/out of range."""
+    entry = entries.get(tag)
+    if entry is None:
+        return None
+    value_type, count, value_offset = entry
+    if value_type != 2 or count <= 4:  # EXIF dates are ASCII and never stored inline
+        return None
+    raw = tiff[value_offset:value_offset + count]
+    if len(raw) != count:
+        return None
+    return raw.split(b'\x00', 1)[0].decode('ascii', 'replace') or None
+
+def _read_ifd(tiff: bytes, offset: int, order: str) -> dict[int, tuple[int, int, int]]:
+    """Parse one TIFF IFD into {tag: (type, count, value_or_offset)}."""
+    (count,) = struct.unpack_from(f'{order}H', tiff, offset)
+    entries = {}
+    for index in range(count):
+        tag, value_type, value_count, value = struct.unpack_from(
+            f'{order}HHII', tiff, offset + 2 + 12 * index
+        )
+        entries[tag] = (value_type, value_count, value)
+    return entries
 
-    Args:
-        image_path (Path): Path to the image file (e.g., JPEG, HEIC).
-        logger (logging.Logger): Logger for debug and exception messages.
+def _parse_tiff_timestamp(tiff: bytes) -> Optional[tuple[str, str]]:
+    """Find DateTimeOriginal or DateTime in a TIFF-structured EXIF block.
 
     Returns:
-        datetime or None: The extracted timestamp in UTC if available,
-        otherwise fallback timestamp in UTC.
+        Optional[tuple[str, str]]: The raw timestamp and its source description,
+        or None if the block is malformed, truncated, or has no timestamp.
     """
-    datetime_original_tag = 36867  # DateTimeOriginal
-    datetime_tag = 306             # DateTime
+    if tiff[:4] == b'II*\x00':
+        order = '<'
+    elif tiff[:4] == b'MM\x00*':
+        order = '>'
+    else:
+        return None
 
     try:
+        (ifd0_offset,) = struct.unpack_from(f'{order}I', tiff, 4)
+        ifd0 = _read_ifd(tiff, ifd0_offset, order)
+        exif_ifd = {}
+        if _EXIF_IFD_POINTER in ifd0:
+            exif_ifd = _read_ifd(tiff, ifd0[_EXIF_IFD_POINTER][2], order)
+    except struct.error:
+        return None
+
+    raw_ts = (_tiff_ascii_value(tiff, exif_ifd, _DATETIME_ORIGINAL_TAG)
+              or _tiff_ascii_value(tiff, ifd0, _DATETIME_ORIGINAL_TAG))
+    if raw_ts:
+        return raw_ts, "EXIF DateTimeOriginal"
+    raw_ts = _tiff_ascii_value(tiff, ifd0, _DATETIME_TAG)
+    if raw_ts:
+        return raw_ts, "EXIF DateTime"
+    return None
+
+def _find_jpeg_exif(head: bytes) -> Optional[bytes]:
+    """Walk JPEG segment markers to the APP1 Exif payload (the TIFF block)."""
+    pos = 2
+    while pos + 4 <= len(head):
+        if head[pos] != 0xFF:
+            return None
+        marker = head[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):  # end of image / start of scan: no more metadata
+            return None
+        (length,) = struct.unpack_from('>H', head, pos + 2)
+        if marker == 0xE1 and head[pos + 4:pos + 10] == _EXIF_HEADER:
+            return head[pos + 10:pos + 2 + length]
+        pos += 2 + length
+    return None
+
+def _find_png_exif(head: bytes) -> Optional[bytes]:
+    """Walk PNG chunks to the eXIf payload (the TIFF block)."""
+    pos = len(_PNG_SIGNATURE)
+    while pos + 8 <= len(head):
+        length, chunk_type = struct.unpack_from('>I4s', head, pos)
+        if chunk_type == b'eXIf':
+            return head[pos + 8:pos + 8 + length]
+        if chunk_type in (b'IDAT', b'IEND'):
+            return None
+        pos += 12 + length  # length + type + data + CRC
+    return None
+
+def _read_app1_exif(image_path: Path) -> Optional[tuple[str, str]]:
+    """Read the EXIF timestamp straight from the first bytes of an image file.
+
+    JPEG files are walked marker by marker to the APP1 segment and PNG files
+    chunk by chunk to the eXIf chunk; other formats (e.g., HEIC) are searched
+    for an ``Exif\\0\\0`` header. Only the file header is read, so large
+    images cost kilobytes of I/O instead of megabytes.
+
+    Args:
+        image_path (Path): Path to the image file.
+
+    Returns:
+        Optional[tuple[str, str]]: The raw timestamp and its source description,
+        or None if the header could not be read or parsed (callers should then
+        fall back to Pillow).
+    """
+    try:
+        with open(image_path, 'rb') as image_file:
+            head = image_file.read(_EXIF_SCAN_BYTES)
+    except OSError:
+        return None
+
+    if head[:2] == b'\xff\xd8':
+        tiff = _find_jpeg_exif(head)
+        return _parse_tiff_timestamp(tiff) if tiff else None
+    if head.startswith(_PNG_SIGNATURE):
+        tiff = _find_png_exif(head)
+        return _parse_tiff_timestamp(tiff) if tiff else None
+
+    start = head.find(_EXIF_HEADER)
+    while start != -1:
+        # The marker can also appear as an item type name; keep looking
+        if result := _parse_tiff_timestamp(head[start + len(_EXIF_HEADER):]):
+            return result
+        start = head.find(_EXIF_HEADER, start + 1)
+    return None
+
+def _read_exif_datetime(image_path: Path) -> tuple[Optional[datetime], str, Optional[float]]:
+    """Reads the original capture timestamp from an image's EXIF metadata.
+
+    Performs no logging so it can run inside a worker process. When Pillow
+    opens the image but finds no timestamp, the modification time is read from
+    the still-open handle with fstat so the fallback does not stat the path again.
+
+    Args:
+        image_path (Path): Path to the image file (e.g., JPEG, HEIC).
+
+    Returns:
+        tuple[Optional[datetime], str, Optional[float]]: The timestamp in UTC
+        (None if the image has no EXIF timestamp), a description of its source,
+        and the file's modification time if it was read for the fallback.
+
+    Raises:
+        UnidentifiedImageError: If Pillow cannot identify the image.
+        OSError, ValueError, KeyError: If the file or its EXIF data is unreadable.
+    """
+    if header_ts := _read_app1_exif(image_path):
+        raw_ts, source = header_ts
+    else:
         with Image.open(image_path) as img_file:
             exif = img_file.getexif()
-            raw_ts = None
 
-            if datetime_original_tag in exif:
-                raw_ts = exif[datetime_original_tag]
+            if _DATETIME_ORIGINAL_TAG in exif:
+                raw_ts = exif[_DATETIME_ORIGINAL_TAG]
                 source = "EXIF DateTimeOriginal"
-            elif datetime_tag in exif:
-                raw_ts = exif[datetime_tag]
+            elif _DATETIME_TAG in exif:
+                raw_ts = exif[_DATETIME_TAG]
                 source = "EXIF DateTime"
             else:
-                raw_ts = None
-                source = "no EXIF timestamp"
-
-            if raw_ts:
-                naive_dt = datetime.strptime(raw_ts, "%Y:%m:%d %H:%M:%S")
-                utc_dt = naive_dt.replace(tzinfo=timezone.utc)
-                logger.debug("%s timestamp extracted from %s: %s",
-                             image_path.name,
-                             source,
-                             utc_dt.isoformat())
-                return utc_dt, source
+                # Some plugins close the file once getexif() has loaded the image
+                fp = img_file.fp
+                return None, "no EXIF timestamp", os.fstat(fp.fileno()).st_mtime if fp else None
 
-    except UnidentifiedImageError as e:
-        file_size = image_path.stat().st_size
-        mime_type, _ = mimetypes.guess_type(image_path)
-        logger.error("Image metadata failed (%s), using fallback timestamp", e)
-        logger.debug("%s may be corrupted or misnamed. Size: %d bytes, MIME type: %s",
-                     image_path.name,
-                     file_size,
-                     mime_type)
-    except (OSError, ValueError, KeyError) as e:
-        logger.exception("Unexpected error reading EXIF from %s: %s",
+    if not raw_ts:
+        return None, source, None
+    return _parse_exif_datetime(raw_ts), source, None
+
+def _parse_exif_datetime(raw_ts: str) -> datetime:
+    """Parses an EXIF-style 'YYYY:MM:DD HH:MM:SS' timestamp as UTC.
+
+    The format is fixed-width, so the fields are sliced out directly instead of
+    going through strptime. Anything else is left to strptime, which raises
+    ValueError for malformed values.
+
+    Args:
+        raw_ts (str): Timestamp string from EXIF or exiftool.
+
+    Returns:
+        datetime: The parsed timestamp in UTC.
+    """
+    if (len(raw_ts) == 19 and raw_ts[10] == ' '
+            and raw_ts[4] == raw_ts[7] == raw_ts[13] == raw_ts[16] == ':'):
+        return datetime(int(raw_ts[0:4]), int(raw_ts[5:7]), int(raw_ts[8:10]),
+                        int(raw_ts[11:13]), int(raw_ts[14:16]), int(raw_ts[17:19]), 0, _UTC)
+    return datetime.strptime(raw_ts, "%Y:%m:%d %H:%M:%S").replace(tzinfo=_UTC)
+
+def _resolve_exif_timestamp(image_path: Path,
+                            outcome: tuple[Optional[datetime], str, Optional[Exception]],
+                            logger: logging.Logger,
+                            mtime: Optional[float] = None) -> tuple[datetime, str]:
+    """Logs the outcome of an EXIF read and applies the fallback timestamp if needed.
+
+    Args:
+        image_path (Path): Path to the image file.
+        outcome (tuple): The EXIF timestamp (if any), its source description,
+            and the exception raised while reading EXIF (if any).
+        logger (logging.Logger): Logger for debug and exception messages.
+        mtime (Optional[float]): Known modification time for the fallback.
+
+    Returns:
+        tuple[datetime, str]: The EXIF timestamp and its source, or the fallback
+        timestamp and 'fallback'.
+    """
+    exif_dt, source, error = outcome
+    if exif_dt is not None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s timestamp extracted from %s: %s",
                          image_path.name,
-                         e)
+                         source,
+                         exif_dt.isoformat())
+        return exif_dt, source
+
+    if isinstance(error, UnidentifiedImageError):
+        logger.error("Image metadata failed (%s), using fallback timestamp", error)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s may be corrupted or misnamed. Size: %d bytes, MIME type: %s",
+                         image_path.name,
+                         image_path.stat().st_size,
+                         _EXT_MIME.get(image_path.suffix.lower()))
+    elif error is not None:
+        logger.error("Unexpected error reading EXIF from %s: %s",
+                     image_path.name,
+                     error,
+                     exc_info=error)
 
-    fallback_dt = fallback_timestamp(path=image_path, logger=logger)
-    logger.debug("%s fallback timestamp used: %s",
-                 image_path.name,
-                 fallback_dt.isoformat())
+    fallback_dt = fallback_timestamp(path=image_path, logger=logger, mtime=mtime)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s fallback timestamp used: %s",
+                     image_path.name,
+                     fallback_dt.isoformat())
     return fallback_dt, 'fallback'
 
+def extract_exif_timestamp(image_path: Path,
+                           logger: logging.Logger,
+                           mtime: Optional[float] = None) -> Tuple[Optional[datetime], str]:
+    """Extracts the original capture timestamp from an image's EXIF metadata,
+    normalized to UTC. Falls back to filename-based timestamp if EXIF is unreadable.
+
+    Args:
+        image_path (Path): Path to the image file (e.g., JPEG, HEIC).
+        logger (logging.Logger): Logger for debug and exception messages.
+        mtime (Optional[float]): Known modification time for the fallback.
+
+    Returns:
+        datetime or None: The extracted timestamp in UTC if available,
+        otherwise fallback timestamp in UTC.
+    """
+    try:
+        exif_dt, source, file_mtime = _read_exif_datetime(image_path)
+        error = None
+    except (OSError, ValueError, KeyError) as e:  # includes UnidentifiedImageError
+        exif_dt, source, error, file_mtime = None, 'error', e, None
+    if mtime is None:
+        mtime = file_mtime
+    return _resolve_exif_timestamp(image_path, (exif_dt, source, error), logger, mtime)
+
+def _extract_image_meta(
+        path_str: str
+) -> tuple[str, Optional[datetime], str, Optional[Exception], Optional[float]]:
+    """Read an image's EXIF timestamp. Used by the process pool.
+
+    Takes and returns only picklable values; the parent process logs the result
+    and applies any fallback via _resolve_exif_timestamp.
+    """
+    try:
+        exif_dt, source, file_mtime = _read_exif_datetime(Path(path_str))
+        return path_str, exif_dt, source, None, file_mtime
+    except (OSError, ValueError, KeyError) as e:
+        return path_str, None, 'error', e, None
+
+class _ComToken:  # pylint: disable=too-few-public-methods
+    """Lives in a thread's local storage for as long as the thread holds COM."""
+
+
+def _ensure_com_initialized() -> None:
+    """Initializes COM once for the calling thread.
+
+    Called before each propsys read; it is a no-op for threads that are already
+    initialized, so pool workers pay the COM setup cost once. COM is
+    uninitialized when the thread exits and its local storage (holding the
+    token) is released.
+    """
+    if getattr(_com_state, 'token', None) is not None:
+        return
+    pythoncom.CoInitialize()
+    _com_state.token = _ComToken()
+    finalizer = weakref.finalize(_com_state.token, pythoncom.CoUninitialize)
+    # Only the owning thread may uninitialize; skip it at interpreter shutdown
+    finalizer.atexit = False
+
 def extract_video_timestamp(video_path: Path,
-                            logger: logging.Logger) -> tuple[Optional[datetime], str]:
+                            logger: logging.Logger,
+                            mtime: Optional[float] = None) -> tuple[Optional[datetime], str]:
     """Extracts the creation timestamp from a video file using propsys or ffprobe,
     normalized to UTC.
 
     Args:
         video_path (Path): Path to the video file (e.g., MOV, MP4).
         logger (logging.Logger): Logger for debug and warning messages.
+        mtime (Optional[float]): Known modification time for the fallback.
 
     Returns:
         datetime or None: The extracted timestamp in UTC if found,
@@ -247,20 +621,20 @@ def extract_video_timestamp(video_path: Path,
     # Try Windows propsys first (only on Windows)
     if WINDOWS_AVAILABLE:
         try:
-            # Initialize COM for this thread (required for multithreading)
-            pythoncom.CoInitialize()
-            try:
-                properties = propsys.SHGetPropertyStoreFromParsingName(resolved_path)
-                date_created = properties.GetValue(pscon.PKEY_Media_DateEncoded).GetValue()
+            # COM stays initialized for the life of the worker thread
+            _ensure_com_initialized()
+            # Open the store once and try each date key on it
+            properties = propsys.SHGetPropertyStoreFromParsingName(resolved_path)
+            for key_name in _PROPSYS_DATE_KEYS:
+                date_created = properties.GetValue(getattr(pscon, key_name)).GetValue()
                 if isinstance(date_created, datetime):
-                    utc_dt = date_created.astimezone(timezone.utc)
-                    logger.debug(("%s timestamp extracted from propsys: %s"),
-                                 video_path.name,
-                                 utc_dt.isoformat())
+                    utc_dt = date_created.astimezone(_UTC)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(("%s timestamp extracted from propsys %s: %s"),
+                                     video_path.name,
+                                     key_name,
+                                     utc_dt.isoformat())
                     return utc_dt, 'propsys'
-            finally:
-                # Always uninitialize COM when done
-                pythoncom.CoUninitialize()  # pylint: disable=no-member
         except (OSError, AttributeError, ValueError, com_error) as e:
             logger.warning("%s propsys metadata failed: %s, trying ffprobe",
                            video_path.name,
@@ -268,37 +642,99 @@ def extract_video_timestamp(video_path: Path,
     else:
         logger.debug("%s skipping propsys (not available on this platform)", video_path.name)
 
-    # Fallback to ffprobe
+    # Fallback to ffprobe; creation_time is a container tag, so skip stream probing
     try:
         result = subprocess.run([
-            'ffprobe', '-v', 'quiet', '-print_format', 'json',
+            'ffprobe', '-v', 'quiet',
+            '-fflags', '+fastseek', '-probesize', '32', '-analyzeduration', '0',
+            '-print_format', 'json',
             '-show_entries', 'format_tags=creation_time',
             '-i', str(video_path)
         ],
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
         check=False)
 
-        data = json.loads(result.stdout)
+        data = _json_loads(result.stdout or b'{}')
         if ts := data.get('format', {}).get('tags', {}).get('creation_time'):
             # Normalize ISO timestamp to UTC
-            parsed_dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-            utc_dt = parsed_dt.astimezone(timezone.utc)
-            logger.debug("%s timestamp extracted from ffprobe: %s",
-                         video_path.name,
-                         utc_dt.isoformat())
+            utc_dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
+            if utc_dt.tzinfo is not _UTC:  # 'Z' and '+00:00' already parse to the UTC singleton
+                utc_dt = utc_dt.astimezone(_UTC)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s timestamp extracted from ffprobe: %s",
+                             video_path.name,
+                             utc_dt.isoformat())
             return utc_dt, 'ffprobe'
-    except subprocess.CalledProcessError as e:
+    except (OSError, ValueError, subprocess.CalledProcessError) as e:
         logger.warning("%s ffprobe failed: %s, using fallback timestamp",
                        video_path.name,
                        e)
 
     # Final fallback
     return fallback_timestamp(path=video_path,
-                              logger=logger), 'fallback'
+                              logger=logger,
+                              mtime=mtime), 'fallback'
+
+def extract_video_timestamps_batch(video_paths: list[Path],
+                                   logger: logging.Logger) -> dict[Path, tuple[datetime, str]]:
+    """Extracts creation timestamps for many videos with a single exiftool process,
+    normalized to UTC.
+
+    ffprobe can only open one input per process, so the batch path uses exiftool
+    (when it is installed) with its argument list streamed over stdin. Videos that
+    are missing from the result should be read with extract_video_timestamp.
+
+    Args:
+        video_paths (list[Path]): Paths to the video files (e.g., MOV, MP4).
+        logger (logging.Logger): Logger for debug and warning messages.
+
+    Returns:
+        dict[Path, tuple[datetime, str]]: Timestamp and source for every video
+        whose QuickTime CreateDate could be read.
+    """
+    if not video_paths or shutil.which('exiftool') is None:
+        return {}
+
+    # Absolute paths keep a relative name such as "-x.mov" from being read as an option
+    by_name = {p.resolve().as_posix(): p for p in video_paths}
+    # -fast skips trailer scans; -fast2 is avoided as it stops at mdat, before a trailing moov
+    args = ['-json', '-quiet', '-fast', '-charset', 'filename=utf8', '-QuickTime:CreateDate']
+    args.extend(by_name)
+    try:
+        result = subprocess.run(['exiftool', '-@', '-'],
+                                input='\n'.join(args).encode('utf-8'),
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL,
+                                check=False)
+        records = _json_loads(result.stdout or b'[]')
+    except (OSError, ValueError) as e:
+        logger.warning("exiftool batch metadata failed: %s, reading videos individually", e)
+        return {}
+
+    timestamps: dict[Path, tuple[datetime, str]] = {}
+    for record in records:
+        video_path = by_name.get(record.get('SourceFile'))
+        raw_ts = record.get('CreateDate')
+        if video_path is None or not raw_ts:
+            continue
+        try:
+            # QuickTime stores CreateDate in UTC
+            utc_dt = _parse_exif_datetime(raw_ts)
+        except (TypeError, ValueError):
+            # Unset dates are reported as "0000:00:00 00:00:00"
+            continue
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s timestamp extracted from exiftool: %s",
+                         video_path.name,
+                         utc_dt.isoformat())
+        timestamps[video_path] = (utc_dt, 'exiftool')
+    return timestamps
 
 def get_media_created_date_time(filename: Path,
-                                logger: logging.Logger) -> tuple[Optional[datetime], str]:
+                                logger: logging.Logger,
+                                mtime: Optional[float] = None,
+                                suffix: Optional[str] = None) -> tuple[Optional[datetime], str]:
     """Extract the creation timestamp from image or video metadata.
 
     Attempts to read EXIF or video metadata. Falls back to filesystem timestamp.
@@ -306,64 +742,215 @@ def get_media_created_date_time(filename: Path,
     Args:
         filename (Path): Path to the media file.
         logger (logging.Logger): Logger instance.
+        mtime (Optional[float]): Known modification time for the fallback.
+        suffix (Optional[str]): Lowercased suffix, if the caller already has it.
 
     Returns:
         datetime: The creation datetime (timezone-aware if possible).
     """
     logger.debug('Extracting timestamp from %s', filename.name)
-    suffix = filename.suffix.lower()
+    if suffix is None:
+        suffix = filename.suffix.lower()
 
     if suffix in VIDEO_FORMATS:
-        return extract_video_timestamp(filename, logger)
+        return extract_video_timestamp(filename, logger, mtime)
     if suffix in IMG_FORMATS:
-        return extract_exif_timestamp(filename, logger)
+        return extract_exif_timestamp(filename, logger, mtime)
 
     # Fallback for unknown file types - use birthtime if available, else mtime
     stat_info = filename.stat()
     if hasattr(stat_info, 'st_birthtime'):
-        return datetime.fromtimestamp(stat_info.st_birthtime, tz=timezone.utc), 'birthtime'
-    return fallback_timestamp(filename, logger), 'fallback'
+        return datetime.fromtimestamp(stat_info.st_birthtime, _UTC), 'birthtime'
+    return fallback_timestamp(filename, logger, stat_info.st_mtime), 'fallback'
+
+def _extract_single_file_metadata(
+        file: Path,
+        logger: logging.Logger,
+        known_timestamps: Optional[dict[Path, tuple[datetime, str]]] = None,
+        mtime: Optional[float] = None,
+        suffix: Optional[str] = None
+) -> Optional[FileMetadata]:
+    """Extract metadata for a single file. Used by parallel executor.
+
+    Timestamps already gathered by a batch extractor are used as-is. Callers
+    that have already classified the file pass its lowercased ``suffix``;
+    otherwise the file name is checked against SUFFIX_RE here.
+    """
+    if suffix is None:
+        if not SUFFIX_RE.search(file.name):
+            return None
+        suffix = file.suffix.lower()
+    if known_timestamps and file in known_timestamps:
+        timestamp, source = known_timestamps[file]
+    else:
+        timestamp, source = get_media_created_date_time(file, logger, mtime, suffix)
+    return _make_file_metadata(file, suffix, timestamp, source)
 
-def _extract_single_file_metadata(file: Path,
-                                   logger: logging.Logger) -> Optional[FileMetadata]:
-    """Extract metadata for a single file. Used by parallel executor."""
-    if file.suffix.lower() not in ALLOWED_SUFFIXES:
-        return None
-    timestamp, source = get_media_created_date_time(file, logger)
+
+def _make_file_metadata(file: Path,
+                        suffix: str,
+                        timestamp: datetime,
+                        source: str) -> FileMetadata:
+    """Build the FileMetadata entry for a file, its lowercased suffix and its timestamp."""
     return FileMetadata(
         original_path=file,
         timestamp=timestamp,
-        extension=file.suffix.lower(),
+        extension=suffix,
         original_name=file.name,
         metadata_reliable=source.lower() not in ('fallback', 'birthtime'),
         timestamp_source=source
     )
 
 
+def _collect_image_metadata(images: dict[str, tuple[Path, str]],
+                            logger: logging.Logger,
+                            mtimes: dict[Path, float]) -> list[FileMetadata]:
+    """Read EXIF timestamps for images in a process pool and build their metadata.
+
+    Workers receive and return plain strings and tuples; logging and fallbacks
+    run in this process. ``images`` maps each path string back to the scanned
+    ``Path`` and its lowercased suffix, so results reuse that object (and its
+    cached hash) instead of building a new one per file.
+    """
+    metadata_list: list[FileMetadata] = []
+    workers = min(len(images), os.cpu_count() or 1)
+    # Send paths in chunks (about four per worker) to cut per-item IPC round trips
+    chunksize = max(1, len(images) // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for path_str, exif_dt, source, error, file_mtime in pool.map(_extract_image_meta,
+                                                                     images,
+                                                                     chunksize=chunksize):
+            image_path, suffix = images[path_str]
+            timestamp, source = _resolve_exif_timestamp(
+                image_path, (exif_dt, source, error), logger, mtimes.get(image_path, file_mtime)
+            )
+            metadata_list.append(_make_file_metadata(image_path, suffix, timestamp, source))
+    return metadata_list
+
+
+def _metadata_order(entry: FileMetadata) -> tuple[datetime, str]:
+    """Sort key for metadata entries: timestamp, then original name."""
+    return entry.timestamp, entry.original_name
+
+
 def collect_file_metadata(file_list: list[Path],
-                          logger: logging.Logger) -> list[FileMetadata]:
+                          logger: logging.Logger,
+                          mtimes: Optional[dict[Path, float]] = None) -> list[FileMetadata]:
     """Collects metadata for each file including timestamp and renaming info.
 
-    Uses parallel processing for improved performance on large folders.
+    Uses parallel processing for improved performance on large folders. EXIF
+    parsing is CPU-bound, so images are read in a process pool; videos are
+    I/O-bound (propsys, ffprobe) and stay on a thread pool.
+
+    Modification times from the directory scan (``mtimes``) are reused for the
+    fallback timestamp so those files are not stat'ed again.
     """
     metadata_list: list[FileMetadata] = []
+    mtimes = mtimes or {}
+    # Lowercase each suffix once here and hand it on; unsupported files are dropped
+    images: dict[str, tuple[Path, str]] = {}
+    videos: dict[Path, str] = {}
+    for f in file_list:
+        suffix = f.suffix.lower()
+        if suffix in IMG_FORMATS:
+            images[str(f)] = (f, suffix)
+        elif suffix in VIDEO_FORMATS:
+            videos[f] = suffix
+
+    # Without propsys every video would spawn its own ffprobe; read them in one go
+    known_timestamps: dict[Path, tuple[datetime, str]] = {}
+    if not WINDOWS_AVAILABLE:
+        known_timestamps = extract_video_timestamps_batch(list(videos), logger)
 
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
         futures = {
-            executor.submit(_extract_single_file_metadata, f, logger): f
-            for f in file_list
+            executor.submit(_extract_single_file_metadata,
+                            f, logger, known_timestamps, mtimes.get(f), suffix): f
+            for f, suffix in videos.items()
         }
+        if images:
+            metadata_list.extend(_collect_image_metadata(images, logger, mtimes))
         for future in as_completed(futures):
             result = future.result()
             if result is not None:
                 metadata_list.append(result)
 
+    # Sort once here so every later phase sees the same stable order
+    metadata_list.sort(key=_metadata_order)
+
     return metadata_list
 
+def _claim_output(dst_path: Path, commit: bool) -> bool:
+    """Checks that a conversion output is free and, in commit mode, reserves it.
+
+    In commit mode the output is created empty with ``O_EXCL``, so a single
+    call both detects an existing file and claims the name before the
+    converter runs (converters overwrite the placeholder). An existing empty
+    output is the placeholder of a run that died mid-conversion, so it counts
+    as free and is reclaimed. Dry runs only check the size, so they never
+    touch the folder.
+
+    Args:
+        dst_path (Path): Path of the converted file.
+        commit (bool): If True, create the placeholder.
+
+    Returns:
+        bool: False if a non-empty ``dst_path`` already exists.
+    """
+    if not commit:
+        return not _output_size(dst_path)
+    try:
+        fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_CLOEXEC', 0))
+    except FileExistsError:
+        return not _output_size(dst_path)
+    os.close(fd)
+    return True
+
+def _output_size(dst_path: Path) -> int:
+    """Returns the size of a conversion output, or 0 if it is missing."""
+    try:
+        return os.stat(dst_path).st_size
+    except OSError:
+        return 0
+
+def _decode_heic_to_jpg(src_path: Path, dst_path: Path) -> None:
+    """Decode a .heic file with Pillow and write it as a .jpg, keeping its EXIF and ICC profile.
+
+    Removes any partially written .jpg before re-raising, so callers can treat
+    the existence of ``dst_path`` as success.
+
+    Raises:
+        OSError: If the image cannot be decoded or written.
+    """
+    try:
+        with Image.open(src_path) as image:
+            # iPhone HEICs are Display P3; dropping the profile would shift their colours
+            image.convert('RGB').save(dst_path, 'JPEG', quality=_HEIC_JPEG_QUALITY,
+                                      exif=image.info.get('exif', b''),
+                                      icc_profile=image.info.get('icc_profile'))
+    except OSError:
+        dst_path.unlink(missing_ok=True)
+        raise
+
+def _run_heic_conversion(src_path: Path, dst_path: Path) -> None:
+    """Convert one .heic file in-process when pillow-heif is installed, else via ImageMagick.
+
+    Raises:
+        OSError: If the in-process conversion fails.
+        subprocess.CalledProcessError: If ImageMagick fails.
+    """
+    if HEIF_AVAILABLE:
+        _decode_heic_to_jpg(src_path, dst_path)
+    else:
+        subprocess.run(
+            ['magick', str(src_path), '-define', 'heic:preserve-exif=true', str(dst_path)],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+
 def convert_heic_to_jpg(src_path: Path,
                         commit: bool,
                         logger: logging.Logger) -> Optional[Path]:
-    """Convert a .heic file to .jpg using ImageMagick.
+    """Convert a .heic file to .jpg using pillow-heif, or ImageMagick without it.
 
     Args:
         src_path (Path): Path to the .heic file.
@@ -374,37 +961,146 @@ def convert_heic_to_jpg(src_path: Path,
         Optional[Path]: Path to the new .jpg file if successful, None if failed.
     """
     dst_path = src_path.with_suffix('.jpg')
-    if dst_path.exists():
+    if not _claim_output(dst_path, commit):
         logger.info("Skipping conversion: %s already exists", dst_path.name)
         return dst_path
 
     logger.info("Converting %s to %s", src_path.name, dst_path.name)
     if commit:
         try:
-            subprocess.run(
-                ['magick', str(src_path), '-define', 'heic:preserve-exif=true', str(dst_path)],
-                check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
-            if dst_path.exists():
-                logger.info("Conversion successful: %s", dst_path.name)
-                try:
-                    send2trash(str(src_path))
-                    logger.info("Sent original .heic file to Recycle Bin: %s", src_path.name)
-                except OSError as e:
-                    logger.error("Failed to send original .heic file to Recycle Bin: %s", e)
-            else:
-                logger.error(
-                    "Conversion failed: %s not found after conversion", dst_path.name
-                )
-                return None
-        except subprocess.CalledProcessError as e:
+            _run_heic_conversion(src_path, dst_path)
+        except (OSError, subprocess.CalledProcessError) as e:
             logger.error("Conversion failed for %s: %s", src_path.name, e)
+            dst_path.unlink(missing_ok=True)
+            return None
+        if not _output_size(dst_path):
+            logger.error("Conversion failed: %s not written by conversion", dst_path.name)
+            dst_path.unlink(missing_ok=True)
             return None
+        logger.info("Conversion successful: %s", dst_path.name)
+        try:
+            send2trash(str(src_path))
+            logger.info("Sent original .heic file to Recycle Bin: %s", src_path.name)
+        except OSError as e:
+            logger.error("Failed to send original .heic file to Recycle Bin: %s", e)
     else:
         logger.info("Would convert %s to %s", src_path.name, dst_path.name)
 
     return dst_path
 
+def _decode_heic_pending(pending: list[Path], logger: logging.Logger) -> None:
+    """Convert .heic files in-process on a thread pool; Pillow releases the GIL while coding."""
+    def decode(src_path: Path) -> None:
+        try:
+            _decode_heic_to_jpg(src_path, src_path.with_suffix('.jpg'))
+        except OSError as e:
+            logger.error("Conversion failed for %s: %s", src_path.name, e)
+
+    with ThreadPoolExecutor(max_workers=min(len(pending), MAX_WORKERS)) as executor:
+        list(executor.map(decode, pending))
+
+def _mogrify_heic_pending(pending: list[Path], logger: logging.Logger) -> bool:
+    """Convert .heic files with one ``magick mogrify`` process fed by an argument file.
+
+    Returns:
+        bool: True if mogrify got through every file.
+    """
+    # ImageMagick reads filenames from "@file" quoted with " or ' (it has no
+    # escape character), so quote with whichever the name lacks; names with
+    # both are passed on the command line instead
+    listed: list[str] = []
+    unquotable: list[str] = []
+    for path in pending:
+        name = path.as_posix()
+        if '"' not in name:
+            listed.append(f'"{name}"')
+        elif "'" not in name:
+            listed.append(f"'{name}'")
+        else:
+            unquotable.append(name)
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', encoding='utf-8',
+                                     delete=False) as list_file:
+        list_file.write('\n'.join(listed))
+    try:
+        subprocess.run(
+            ['magick', 'mogrify', '-format', 'jpg',
+             '-define', 'heic:preserve-exif=true', *unquotable, f'@{list_file.name}'],
+            check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+    except subprocess.CalledProcessError as e:
+        # mogrify stops at the first bad file; keep whatever it converted
+        logger.error("Batch conversion failed: %s", e)
+        return False
+    finally:
+        os.unlink(list_file.name)
+    return True
+
+def convert_heic_batch(src_paths: list[Path],
+                       commit: bool,
+                       logger: logging.Logger) -> dict[Path, Path]:
+    """Convert many .heic files to .jpg in-process or with a single ImageMagick invocation.
+
+    With pillow-heif installed the files are decoded by Pillow on a thread
+    pool, with no process spawned at all. Otherwise all pending files are
+    listed in a temporary argument file and converted by one ``magick mogrify``
+    process, so process startup and codec loading are paid once per batch
+    instead of once per file. If mogrify stops at a bad file, the files it
+    did not reach are converted one at a time with convert_heic_to_jpg.
+
+    Args:
+        src_paths (list[Path]): Paths to the .heic files.
+        commit (bool): If True, perform the conversions and delete the originals.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        dict[Path, Path]: Mapping of each successfully converted (or, in dry-run
+        mode, convertible) source path to its .jpg path.
+    """
+    converted: dict[Path, Path] = {}
+    pending: list[Path] = []
+
+    for src_path in src_paths:
+        dst_path = src_path.with_suffix('.jpg')
+        if not _claim_output(dst_path, commit):
+            logger.info("Skipping conversion: %s already exists", dst_path.name)
+            converted[src_path] = dst_path
+        elif commit:
+            logger.info("Converting %s to %s", src_path.name, dst_path.name)
+            pending.append(src_path)
+        else:
+            logger.info("Would convert %s to %s", src_path.name, dst_path.name)
+            converted[src_path] = dst_path
+
+    if not pending:
+        return converted
+
+    if HEIF_AVAILABLE:
+        _decode_heic_pending(pending, logger)
+        retry_singly = False
+    else:
+        retry_singly = not _mogrify_heic_pending(pending, logger)
+
+    for src_path in pending:
+        dst_path = src_path.with_suffix('.jpg')
+        if not _output_size(dst_path):
+            if retry_singly:
+                # mogrify stopped before (or at) this file; try it on its own
+                if single_path := convert_heic_to_jpg(src_path, commit, logger):
+                    converted[src_path] = single_path
+                continue
+            logger.error("Conversion failed: %s not written by conversion", dst_path.name)
+            dst_path.unlink(missing_ok=True)
+            continue
+        logger.info("Conversion successful: %s", dst_path.name)
+        converted[src_path] = dst_path
+        try:
+            send2trash(str(src_path))
+            logger.info("Sent original .heic file to Recycle Bin: %s", src_path.name)
+        except OSError as e:
+            logger.error("Failed to send original .heic file to Recycle Bin: %s", e)
+
+    return converted
+
 def convert_mov_to_mp4(src_path: Path,
                        commit: bool,
                        logger: logging.Logger) -> Optional[Path]:
@@ -419,20 +1115,22 @@ def convert_mov_to_mp4(src_path: Path,
         Optional[Path]: Path to the new .mp4 file if successful, None if failed.
     """
     dst_path = src_path.with_suffix('.mp4')
-    if dst_path.exists():
+    if not _claim_output(dst_path, commit):
         logger.info("Skipping conversion: %s already exists", dst_path.name)
         return dst_path
 
     logger.info("Converting %s to %s", src_path.name, dst_path.name)
-    cmd = [
-        'ffmpeg', '-y', '-i', str(src_path),
-        '-c:v', 'libx264', '-preset', 'fast', '-pix_fmt', 'yuv420p',
-        '-c:a', 'aac', '-movflags', '+faststart', str(dst_path)
-    ]
+    cmd = ['ffmpeg', '-y', '-i', str(src_path), *_MP4_ENCODE_ARGS, str(dst_path)]
 
     if commit:
-        result = subprocess.run(cmd, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if result.returncode == 0 and dst_path.exists() and dst_path.stat().st_size > 100000:
+        try:
+            result = subprocess.run(cmd, check=False,
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        except OSError as e:
+            logger.error("Conversion failed for %s: %s", src_path.name, e)
+            dst_path.unlink(missing_ok=True)
+            return None
+        if result.returncode == 0 and _output_size(dst_path) > _MIN_MP4_BYTES:
             logger.info("Conversion successful: %s", dst_path.name)
             try:
                 send2trash(str(src_path))
@@ -443,11 +1141,122 @@ def convert_mov_to_mp4(src_path: Path,
             logger.error(
                 "Conversion failed for %s: %s", src_path.name, result.stderr.decode()
             )
+            # Drop the placeholder or partial output so the next run retries
+            dst_path.unlink(missing_ok=True)
             return None
     else:
         logger.info("Would run: %s", ' '.join(cmd))
     return dst_path
 
+def _mov_batch_command(pending: list[Path]) -> list[str]:
+    """Builds one ffmpeg argv that encodes every pending .mov to its own .mp4.
+
+    Each output maps only its own input's first video and (optional) audio
+    stream; without explicit maps ffmpeg would pick streams across all inputs.
+    """
+    cmd = ['ffmpeg', '-y']
+    for src_path in pending:
+        cmd.extend(['-i', str(src_path)])
+    for index, src_path in enumerate(pending):
+        cmd.extend(['-map', f'{index}:v:0', '-map', f'{index}:a:0?', *_MP4_ENCODE_ARGS,
+                    str(src_path.with_suffix('.mp4'))])
+    return cmd
+
+def _run_mov_batch(pending: list[Path], logger: logging.Logger) -> bool:
+    """Runs one ffmpeg process for a group of .mov files.
+
+    Returns:
+        bool: True if ffmpeg exited cleanly, so every output it wrote is complete.
+    """
+    try:
+        result = subprocess.run(_mov_batch_command(pending), check=False,
+                                stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    except OSError as e:
+        logger.error("Batch conversion failed: %s", e)
+        return False
+    if result.returncode != 0:
+        logger.error("Batch conversion failed: %s", result.stderr.decode())
+        return False
+    return True
+
+def _convert_mov_group(group: list[Path],
+                       commit: bool,
+                       logger: logging.Logger) -> dict[Path, Path]:
+    """Converts one group of claimed .mov files with a single ffmpeg run.
+
+    Returns:
+        dict[Path, Path]: Mapping of each converted source path to its .mp4 path.
+    """
+    converted: dict[Path, Path] = {}
+    if not _run_mov_batch(group, logger):
+        for src_path in group:
+            src_path.with_suffix('.mp4').unlink(missing_ok=True)
+            if dst_path := convert_mov_to_mp4(src_path, commit, logger):
+                converted[src_path] = dst_path
+        return converted
+    for src_path in group:
+        dst_path = src_path.with_suffix('.mp4')
+        if _output_size(dst_path) <= _MIN_MP4_BYTES:
+            logger.error("Conversion failed: %s is too small", dst_path.name)
+            dst_path.unlink(missing_ok=True)
+            continue
+        logger.info("Conversion successful: %s", dst_path.name)
+        converted[src_path] = dst_path
+        try:
+            send2trash(str(src_path))
+            logger.info("Sent original .MOV file to Recycle Bin: %s", src_path.name)
+        except OSError as e:
+            logger.error("Failed to send original .MOV file to Recycle Bin: %s", e)
+    return converted
+
+def convert_movs_to_mp4_batch(src_paths: list[Path],
+                              commit: bool,
+                              logger: logging.Logger) -> dict[Path, Path]:
+    """Convert many .mov files to .mp4, several per ffmpeg process.
+
+    Files are encoded in groups of ``_MOV_BATCH_SIZE`` inputs per ffmpeg
+    invocation, so process startup and codec initialization are paid once per
+    group instead of once per file. Up to ``MOV_CONVERT_WORKERS`` groups run
+    at a time. If a group fails, ffmpeg may have stopped part-way through
+    every output, so the group's outputs are discarded and its files are
+    converted one at a time with convert_mov_to_mp4.
+
+    Args:
+        src_paths (list[Path]): Paths to the .mov files.
+        commit (bool): If True, perform the conversions and delete the originals.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        dict[Path, Path]: Mapping of each successfully converted (or, in dry-run
+        mode, convertible) source path to its .mp4 path.
+    """
+    converted: dict[Path, Path] = {}
+    pending: list[Path] = []
+
+    for src_path in src_paths:
+        dst_path = src_path.with_suffix('.mp4')
+        if not _claim_output(dst_path, commit):
+            logger.info("Skipping conversion: %s already exists", dst_path.name)
+            converted[src_path] = dst_path
+        elif commit:
+            logger.info("Converting %s to %s", src_path.name, dst_path.name)
+            pending.append(src_path)
+        else:
+            logger.info("Would convert %s to %s", src_path.name, dst_path.name)
+            converted[src_path] = dst_path
+
+    if not pending:
+        return converted
+
+    groups = [pending[start:start + _MOV_BATCH_SIZE]
+              for start in range(0, len(pending), _MOV_BATCH_SIZE)]
+    with ThreadPoolExecutor(max_workers=min(len(groups), MOV_CONVERT_WORKERS)) as executor:
+        for group_converted in executor.map(
+                lambda group: _convert_mov_group(group, commit, logger), groups):
+            converted.update(group_converted)
+
+    return converted
+
 # Precompiled patterns for filename matching
 PATTERNS_TO_RENAME = [
     re.compile(r'^(IM_|IMG_|IMG_E|VD_)\d+', re.I),
@@ -457,20 +1266,82 @@ PATTERNS_TO_RENAME = [
     re.compile(r'^P([A-Z]|\d)\d{6}', re.I),
     re.compile(r'^(\d{8})-\d+', re.I)
 ]
+# All rename patterns as one alternation so each filename is scanned once;
+# alternatives are tried in list order, matching the first pattern that applies
+COMBINED_PATTERN = re.compile('|'.join(f'(?:{p.pattern})' for p in PATTERNS_TO_RENAME), re.I)
 DEST_PATTERN = re.compile(r'^(\d{8})-\d+', re.I)
 
 
-def parse_filename_date(filename: str) -> Optional[datetime]:
-    """Extract date from filename matching YYYYMMDD-N pattern."""
-    match = DEST_PATTERN.search(filename)
+def parse_filename_date(filename: str,
+                        match: Optional[re.Match[str]] = None) -> Optional[datetime]:
+    """Extract date from filename matching YYYYMMDD-N pattern.
+
+    A DEST_PATTERN match already computed by the caller can be passed in to
+    avoid searching the filename again.
+    """
+    if match is None:
+        match = DEST_PATTERN.search(filename)
     if match:
+        # DEST_PATTERN guarantees eight digits, so slice them instead of using strptime
+        digits = match.group(1)
         try:
-            return datetime.strptime(match.group(1), "%Y%m%d").replace(tzinfo=timezone.utc)
+            return datetime(int(digits[:4]), int(digits[4:6]), int(digits[6:]), 0, 0, 0, 0, _UTC)
         except ValueError:
             return None
     return None
 
 
+def _mark_converted(entry: FileMetadata, converted: Path) -> None:
+    """Points a metadata entry at its converted file."""
+    entry.original_path = converted
+    entry.extension = converted.suffix.lower()
+    entry.was_converted = True
+    # Any skip decision was made for the original file
+    entry.skip_reason = None
+
+
+def _convert_mov_entries(metadata_list: list[FileMetadata],
+                         commit: bool,
+                         logger: logging.Logger) -> int:
+    """Converts every MOV entry with batched ffmpeg runs and updates them in place.
+
+    Returns:
+        Number of MOV files converted.
+    """
+    mov_entries = [e for e in metadata_list if e.extension == '.mov']
+    if not mov_entries:
+        return 0
+    mov_converted = convert_movs_to_mp4_batch([e.original_path for e in mov_entries],
+                                              commit=commit, logger=logger)
+    mov_count = 0
+    for entry in mov_entries:
+        if converted := mov_converted.get(entry.original_path):
+            _mark_converted(entry, converted)
+            mov_count += 1
+    return mov_count
+
+
+def _convert_heic_entries(metadata_list: list[FileMetadata],
+                          commit: bool,
+                          logger: logging.Logger) -> int:
+    """Converts every HEIC entry with one ImageMagick batch and updates them in place.
+
+    Returns:
+        Number of HEIC files converted.
+    """
+    heic_entries = [e for e in metadata_list if e.extension == '.heic']
+    if not heic_entries:
+        return 0
+    heic_converted = convert_heic_batch([e.original_path for e in heic_entries],
+                                        commit=commit, logger=logger)
+    heic_count = 0
+    for entry in heic_entries:
+        if converted := heic_converted.get(entry.original_path):
+            _mark_converted(entry, converted)
+            heic_count += 1
+    return heic_count
+
+
 def convert_files(metadata_list: list[FileMetadata],
                   commit: bool,
                   logger: logging.Logger,
@@ -493,27 +1364,12 @@ def convert_files(metadata_list: list[FileMetadata],
         logger.info("Skipping Apple file conversion (--no-convert flag set)")
         return heic_count, mov_count
 
-    for entry in metadata_list:
-        ext = entry.extension.lower()
-
-        if ext == '.heic':
-            converted = convert_heic_to_jpg(src_path=entry.original_path,
-                                            commit=commit, logger=logger)
-            if converted:
-                entry.original_path = converted
-                entry.extension = '.jpg'
-                entry.was_converted = True
-                heic_count += 1
-        elif ext == '.mov':
-            converted = convert_mov_to_mp4(src_path=entry.original_path,
-                                           commit=commit, logger=logger)
-            if converted and converted.suffix.lower() == '.mp4':
-                entry.original_path = converted
-                entry.extension = '.mp4'
-                entry.was_converted = True
-                mov_count += 1
-        else:
-            logger.debug('No conversion needed for %s', entry.original_path)
+    if logger.isEnabledFor(logging.DEBUG):
+        for entry in metadata_list:
+            if entry.extension not in ('.mov', '.heic'):
+                logger.debug('No conversion needed for %s', entry.original_path)
+    heic_count = _convert_heic_entries(metadata_list, commit, logger)
+    mov_count = _convert_mov_entries(metadata_list, commit, logger)
 
     return heic_count, mov_count
 
@@ -527,8 +1383,7 @@ def should_skip_file(entry: FileMetadata,
         If should_skip is True, extra_text is empty and skip_reason is set.
     """
     filename = entry.original_path.name
-    matched_pattern = next((p for p in PATTERNS_TO_RENAME
-                            if p.search(filename)), None)
+    matched_pattern = COMBINED_PATTERN.match(filename)
 
     if not matched_pattern:
         logger.debug('Skipping %s, no matching pattern', filename)
@@ -536,7 +1391,7 @@ def should_skip_file(entry: FileMetadata,
 
     match = DEST_PATTERN.search(filename)
     if match:
-        filename_dt = parse_filename_date(filename)
+        filename_dt = parse_filename_date(filename, match)
 
         if not entry.metadata_reliable:
             logger.debug("Skipping %s: metadata unavailable, trusting filename", filename)
@@ -550,51 +1405,117 @@ def should_skip_file(entry: FileMetadata,
         logger.info("Renaming %s: filename date mismatch with actual timestamp", filename)
         return False, filename[match.end():], None
 
-    return False, matched_pattern.sub('', filename), None
-
+    return False, filename[matched_pattern.end():], None
 
-def rename_files(metadata_list: list[FileMetadata],
-                 folder_path: Path,
-                 commit: bool,
-                 logger: logging.Logger) -> int:
-    """Rename files matching predefined patterns using their metadata timestamp.
-
-    Returns:
-        Number of files renamed.
-    """
-    rename_count = 0
-    count = 0
-    last_date = ''
 
-    # Cache existing filenames for O(1) collision detection
-    existing_names = {f.name for f in folder_path.iterdir() if f.is_file()}
+@dataclass(**_DATACLASS_OPTIONS)
+class _RenameRun:  # pylint: disable=too-many-instance-attributes
+    """Sequence numbering and collision state for one pass over sorted metadata."""
+    folder_path: Path
+    existing_names: set[str]
+    commit: bool
+    logger: logging.Logger
+    last_day: Optional[date] = None
+    prefix: str = ''
+    count: int = 0
+    rename_count: int = 0
+    # Checked once per run rather than once per entry
+    debug: bool = field(init=False)
 
-    for entry in sorted(metadata_list, key=lambda x: (x.timestamp, x.original_path.name)):
-        prefix = entry.timestamp.strftime("%Y%m%d")
+    def __post_init__(self) -> None:
+        self.debug = self.logger.isEnabledFor(logging.DEBUG)
 
-        if entry.was_converted:
+    def rename(self, entry: FileMetadata) -> None:
+        """Renames one entry to the next free name for its day, unless it is skipped."""
+        logger = self.logger
+        if self.debug and entry.was_converted:
             logger.debug("Converted file %s evaluated for renaming", entry.original_path.name)
 
-        count = count + 1 if last_date == prefix else 0
-        last_date = prefix
+        # Entries are sorted, so the prefix only needs formatting when the day changes
+        day = entry.timestamp.date()
+        if day == self.last_day:
+            self.count += 1
+        else:
+            self.prefix = entry.timestamp.strftime("%Y%m%d")
+            self.last_day = day
+            self.count = 0
+
+        if entry.skip_reason is not None:
+            if self.debug:
+                logger.debug("Skipping %s: %s (cached)",
+                             entry.original_path.name, entry.skip_reason)
+            return
 
         should_skip, extra_text, skip_reason = should_skip_file(entry, logger)
         if should_skip:
             entry.skip_reason = skip_reason
-            continue
+            return
 
-        dst_name = f"{prefix}-{count}{extra_text}"
-        while dst_name in existing_names:
-            count += 1
-            dst_name = f"{prefix}-{count}{extra_text}"
+        dst_name = f"{self.prefix}-{self.count}{extra_text}"
+        while dst_name in self.existing_names:
+            self.count += 1
+            dst_name = f"{self.prefix}-{self.count}{extra_text}"
 
-        if rename_file(entry.original_path, folder_path / dst_name, commit=commit, logger=logger):
+        if rename_file(entry.original_path, self.folder_path / dst_name,
+                       commit=self.commit, logger=logger):
             # Update cache: remove old name, add new name
-            existing_names.discard(entry.original_path.name)
-            existing_names.add(dst_name)
-            rename_count += 1
+            self.existing_names.discard(entry.original_path.name)
+            self.existing_names.add(dst_name)
+            self.rename_count += 1
 
-    return rename_count
+
+def rename_files(metadata_list: list[FileMetadata],
+                 folder_path: Path,
+                 commit: bool,
+                 logger: logging.Logger,
+                 existing_names: set[str]) -> int:
+    """Rename files matching predefined patterns using their metadata timestamp.
+
+    The names of converted files are added to ``existing_names`` first, since
+    a folder scan taken before conversion does not include them.
+
+    Args:
+        metadata_list: List of file metadata to rename, sorted by timestamp
+            (as returned by collect_file_metadata).
+        folder_path: Folder containing the files.
+        commit: If True, perform renames. If False, dry run.
+        logger: Logger instance.
+        existing_names: Names of the files in the folder, used for O(1) collision
+            detection. Updated in place as files are renamed.
+
+    Returns:
+        Number of files renamed.
+    """
+    existing_names.update(e.original_path.name for e in metadata_list if e.was_converted)
+    run = _RenameRun(folder_path, existing_names, commit, logger)
+    for entry in metadata_list:
+        run.rename(entry)
+    return run.rename_count
+
+
+def convert_and_rename(metadata_list: list[FileMetadata],
+                       folder_path: Path,
+                       existing_names: set[str],
+                       stats: ProcessingStats,
+                       logger: logging.Logger) -> None:
+    """Converts files in batches, then renames them in a single pass over the sorted metadata.
+
+    This is convert_files followed by rename_files, so the CLI and callers
+    that use the two steps separately share one code path. Conversion and
+    rename counts are accumulated on ``stats``.
+
+    Args:
+        metadata_list: List of file metadata, sorted by timestamp.
+        folder_path: Folder containing the files.
+        existing_names: Names of the files in the folder. Updated in place.
+        stats: Run options (commit, no_convert) and counters to update.
+        logger: Logger instance.
+    """
+    heic_count, mov_count = convert_files(metadata_list, stats.commit, logger, stats.no_convert)
+    stats.heic_count += heic_count
+    stats.mov_count += mov_count
+    stats.rename_count += rename_files(metadata_list, folder_path, stats.commit, logger,
+                                       existing_names)
 
 
 def log_summary(metadata_list: list[FileMetadata],
@@ -636,10 +1557,144 @@ def log_summary(metadata_list: list[FileMetadata],
     logger.info("Finished in %s seconds", stats.elapsed)
 
 
+def _scan_folder(folder_path: Path) -> tuple[list[Path], dict[Path, float], set[str]]:
+    """Lists supported media files and their modification times in one pass.
+
+    ``os.scandir`` caches the file type (and on Windows the full stat data) on
+    each entry, so filtering needs no extra stat calls. Mtimes are only
+    recorded where they come for free; elsewhere the files that need one are
+    stat'ed later via ``_scan_mtime``.
+
+    Args:
+        folder_path (Path): Folder to scan.
+
+    Returns:
+        tuple[list[Path], dict[Path, float], set[str]]: Files with an allowed
+        suffix, any modification times already known, and the names of all files in the
+        folder (for rename collision checks).
+    """
+    file_list: list[Path] = []
+    mtimes: dict[Path, float] = {}
+    names: set[str] = set()
+    with os.scandir(folder_path) as dir_entries:
+        for dir_entry in dir_entries:
+            if not dir_entry.is_file():
+                continue
+            names.add(dir_entry.name)
+            if SUFFIX_RE.search(dir_entry.name):
+                file_path = Path(dir_entry.path)
+                file_list.append(file_path)
+                if _SCANDIR_CACHES_STAT:
+                    mtimes[file_path] = dir_entry.stat().st_mtime
+    return file_list, mtimes, names
+
+
+def _scan_mtime(path: Path, mtimes: dict[Path, float]) -> Optional[float]:
+    """Returns a scanned file's mtime, stat'ing it on first use if the scan did not.
+
+    Args:
+        path (Path): Path to the file.
+        mtimes (dict[Path, float]): Mtimes from _scan_folder; updated in place.
+
+    Returns:
+        Optional[float]: Modification time, or None if the file cannot be stat'ed.
+    """
+    if path not in mtimes:
+        try:
+            mtimes[path] = _fast_stat_mtime(path)
+        except OSError:
+            return None
+    return mtimes[path]
+
+
+def load_skip_cache(cache_path: Path,
+                    logger: logging.Logger) -> dict[str, tuple[float, str, float]]:
+    """Loads the skip decisions saved by a previous run.
+
+    Args:
+        cache_path (Path): JSON file written by save_skip_cache.
+        logger (logging.Logger): Logger instance.
+
+    Returns:
+        dict[str, tuple[float, str, float]]: File path -> (mtime, skip_reason,
+        POSIX timestamp). Empty if the cache does not exist yet or cannot be read.
+    """
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            return {path: (float(mtime), str(reason), float(timestamp))
+                    for path, (mtime, reason, timestamp) in json.load(cache_file).items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, AttributeError) as e:
+        logger.warning("Ignoring unreadable skip cache %s: %s", cache_path, e)
+        return {}
+
+
+def save_skip_cache(cache_path: Path,
+                    skip_cache: dict[str, tuple[float, str, float]],
+                    logger: logging.Logger) -> None:
+    """Writes skip decisions to disk for the next run.
+
+    Args:
+        cache_path (Path): JSON file to write.
+        skip_cache (dict[str, tuple[float, str, float]]): File path -> (mtime,
+            skip_reason, POSIX timestamp).
+        logger (logging.Logger): Logger instance.
+    """
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as cache_file:
+            json.dump(skip_cache, cache_file)
+    except OSError as e:
+        logger.warning("Failed to write skip cache %s: %s", cache_path, e)
+
+
+def _take_cached_skips(file_list: list[Path],
+                       mtimes: dict[Path, float],
+                       skip_cache: dict[str, tuple[float, str, float]]
+                       ) -> tuple[list[Path], list[FileMetadata]]:
+    """Splits off the files a previous run skipped that have not changed since.
+
+    Their entries are rebuilt from the cached timestamp, so no metadata is
+    extracted for them, yet they keep their place in the sorted run. Only
+    files with a cache entry are stat'ed.
+
+    Returns:
+        tuple[list[Path], list[FileMetadata]]: Files that still need their
+        metadata read, and the entries rebuilt from the cache.
+    """
+    to_read: list[Path] = []
+    cached_entries: list[FileMetadata] = []
+    for path in file_list:
+        cached = skip_cache.get(os.fspath(path))
+        if cached and cached[0] == _scan_mtime(path, mtimes):
+            entry = _make_file_metadata(path, path.suffix.lower(),
+                                        datetime.fromtimestamp(cached[2], _UTC), 'cache')
+            entry.skip_reason = cached[1]
+            cached_entries.append(entry)
+        else:
+            to_read.append(path)
+    return to_read, cached_entries
+
+
+def _update_skip_cache(metadata_list: list[FileMetadata],
+                       mtimes: dict[Path, float],
+                       skip_cache: dict[str, tuple[float, str, float]]) -> None:
+    """Records this run's skip decisions, stat'ing only the skipped files."""
+    for entry in metadata_list:
+        key = os.fspath(entry.original_path)
+        mtime = (_scan_mtime(entry.original_path, mtimes)
+                 if entry.skip_reason and not entry.was_converted else None)
+        if mtime is not None:
+            skip_cache[key] = (mtime, entry.skip_reason, entry.timestamp.timestamp())
+        else:
+            skip_cache.pop(key, None)
+
+
 def process_folder(folder: str,
                    commit: bool,
                    logger: logging.Logger,
-                   no_convert: bool = False) -> int:
+                   no_convert: bool = False,
+                   cache_path: Optional[Path] = None) -> int:
     """
     Processes a folder of media files by converting and renaming them based on metadata.
 
@@ -658,6 +1713,8 @@ def process_folder(folder: str,
         commit (bool): If True, apply changes to disk. If False, simulate actions.
         logger (logging.Logger): Logger instance for recording progress.
         no_convert (bool): If True, skip Apple file conversion.
+        cache_path (Optional[Path]): JSON file remembering which files were skipped,
+            so later runs neither read metadata for nor re-match unchanged files.
 
     Returns:
         int: Exit code. Returns 0 on success.
@@ -666,22 +1723,22 @@ def process_folder(folder: str,
     logger.info('Processing folder: %s', folder)
 
     folder_path = Path(folder)
-    # Use list comprehension with early suffix filtering to reduce unnecessary processing
-    file_list = [f for f in folder_path.iterdir()
-                 if f.is_file() and f.suffix.lower() in ALLOWED_SUFFIXES]
-
-    metadata_list = collect_file_metadata(file_list=file_list, logger=logger)
-    heic_count, mov_count = convert_files(metadata_list, commit, logger, no_convert)
-    rename_count = rename_files(metadata_list, folder_path, commit, logger)
-
-    stats = ProcessingStats(
-        heic_count=heic_count,
-        mov_count=mov_count,
-        rename_count=rename_count,
-        commit=commit,
-        no_convert=no_convert,
-        elapsed=timedelta(seconds=timer() - start)
-    )
+    file_list, mtimes, existing_names = _scan_folder(folder_path)
+
+    skip_cache = load_skip_cache(cache_path, logger) if cache_path else {}
+    file_list, cached_entries = _take_cached_skips(file_list, mtimes, skip_cache)
+    metadata_list = collect_file_metadata(file_list=file_list, logger=logger, mtimes=mtimes)
+    if cached_entries:
+        metadata_list.extend(cached_entries)
+        metadata_list.sort(key=_metadata_order)
+
+    stats = ProcessingStats(commit=commit, no_convert=no_convert)
+    convert_and_rename(metadata_list, folder_path, existing_names, stats, logger)
+    if cache_path:
+        _update_skip_cache(metadata_list, mtimes, skip_cache)
+        save_skip_cache(cache_path, skip_cache, logger)
+
+    stats.elapsed = timedelta(seconds=timer() - start)
     log_summary(metadata_list, stats, logger)
 
     return 0
@@ -717,6 +1774,18 @@ def main():
         default=False,
         help='Skip Apple file conversion (HEIC to JPG and MOV to MP4)'
     )
+    parser.add_argument(
+        '--cache',
+        type=Path,
+        default=None,
+        help='JSON file caching skip decisions for unchanged files between runs'
+    )
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        default=False,
+        help='Buffer log file writes (large folders)'
+    )
     args = parser.parse_args()
 
     folder = args.folder.strip()
@@ -728,10 +1797,10 @@ def main():
         sys.exit(1)
 
     script_name = os.path.basename(sys.argv[0])
-    logger = setup_logger(script_name, verbose=args.verbose)
+    logger = setup_logger(script_name, verbose=args.verbose, bulk=args.bulk)
     logger.info("*** Starting script: %s ***", script_name)
 
-    sys.exit(process_folder(folder, commit, logger, no_convert))
+    sys.exit(process_folder(folder, commit, logger, no_convert, args.cache))
 
 if __name__ == '__main__':  # pragma: no cover
     main()
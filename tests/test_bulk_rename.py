@@ -13,47 +13,123 @@ Dependencies:
     - pytest-mock>=3.12.0
 """
 # pylint: disable=redefined-outer-name,too-many-lines,missing-function-docstring
+# pylint: disable=too-few-public-methods
 
+import gc
+import io
 import json
 import logging
+from logging.handlers import MemoryHandler, TimedRotatingFileHandler
 import os
+import struct
 import subprocess
+import sys
+import threading
+import uuid
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
-from PIL import UnidentifiedImageError
+from PIL import Image, UnidentifiedImageError
 
 from bulk_rename.main import (
     ALLOWED_SUFFIXES,
+    COMBINED_PATTERN,
     DEST_PATTERN,
     IMG_FORMATS,
     MAX_WORKERS,
     PATTERNS_TO_RENAME,
+    SUFFIX_RE,
     VIDEO_FORMATS,
     FileMetadata,
     ProcessingStats,
+    _ensure_com_initialized,
+    _extract_image_meta,
+    _fast_stat_mtime,
+    _parse_exif_datetime,
+    _libc_statx,
+    _read_app1_exif,
+    _mogrify_heic_pending,
+    _scan_folder,
+    _scan_mtime,
     _extract_single_file_metadata,
     collect_file_metadata,
+    convert_and_rename,
     convert_files,
+    convert_heic_batch,
     convert_heic_to_jpg,
     convert_mov_to_mp4,
+    convert_movs_to_mp4_batch,
     extract_exif_timestamp,
     extract_video_timestamp,
+    extract_video_timestamps_batch,
     fallback_timestamp,
     get_media_created_date_time,
+    load_skip_cache,
     log_summary,
     main,
     parse_filename_date,
     process_folder,
     rename_file,
     rename_files,
+    save_skip_cache,
     setup_logger,
     should_skip_file,
 )
 
 
+_NOW = datetime(2023, 1, 1, tzinfo=timezone.utc)
+# Directory for entries whose files are never opened (mocked converters, dry runs)
+_FAKE_DIR = Path("/fake")
+
+
+# pylint: disable-next=too-many-arguments
+def _fm(path, *, ts=_NOW, ext=None, reliable=True, src="EXIF", name=None, **kw):
+    """Build a FileMetadata entry for ``path``, defaulting to a reliable EXIF timestamp."""
+    return FileMetadata(
+        original_path=path,
+        timestamp=ts,
+        extension=ext or path.suffix.lower(),
+        original_name=name or path.name,
+        metadata_reliable=reliable,
+        timestamp_source=src,
+        **kw,
+    )
+
+
+# Opening files relative to a directory descriptor is POSIX-only
+_DIR_FD_OPEN = os.open in os.supports_dir_fd
+
+
+def _mkfiles(base, names_and_bytes):
+    """Write each (name, data) pair into ``base`` with raw os calls and return the paths.
+
+    Where supported, the files are opened relative to one descriptor for ``base``
+    so the directory is only resolved once.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    dir_fd = os.open(base, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0)) if _DIR_FD_OPEN else None
+    try:
+        for name, data in names_and_bytes:
+            target = name if dir_fd is not None else base / name
+            fd = os.open(target, flags, 0o644, dir_fd=dir_fd)
+            try:
+                os.write(fd, data)
+            finally:
+                os.close(fd)
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+    return [base / name for name, _ in names_and_bytes]
+
+
+def _ls(path):
+    """Return the set of entry names in ``path`` from a single directory scan."""
+    with os.scandir(path) as entries:
+        return {entry.name for entry in entries}
+
+
 # =============================================================================
 # Test Fixtures
 # =============================================================================
@@ -72,6 +148,31 @@ def temp_folder(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def mkfile(tmp_path):
+    """Return a factory that writes a small file under tmp_path and returns its path."""
+    def _mkfile(name, data=b"x"):
+        return _mkfiles(tmp_path, [(name, data)])[0]
+    return _mkfile
+
+
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    """Create one directory for the whole session's read-only input files."""
+    return tmp_path_factory.mktemp("shared")
+
+
+@pytest.fixture
+def shared_mkfile(shared_tmp):
+    """Like mkfile, but writes into shared_tmp under a unique prefix instead of a new tmp_path.
+
+    For tests that only read the file back and never look at its name or folder.
+    """
+    def _mkfile(name, data=b"x"):
+        return _mkfiles(shared_tmp, [(f"{uuid.uuid4().hex[:8]}_{name}", data)])[0]
+    return _mkfile
+
+
 @pytest.fixture
 def mock_logger():
     """Create a mock logger."""
@@ -83,22 +184,10 @@ def mock_logger():
 def sample_metadata():
     """Create sample FileMetadata entries."""
     return [
-        FileMetadata(
-            original_path=Path("/test/IMG_1234.jpg"),
-            timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-            extension=".jpg",
-            original_name="IMG_1234.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF DateTimeOriginal",
-        ),
-        FileMetadata(
-            original_path=Path("/test/IMG_5678.jpg"),
-            timestamp=datetime(2023, 10, 15, 14, 0, 0, tzinfo=timezone.utc),
-            extension=".jpg",
-            original_name="IMG_5678.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF DateTimeOriginal",
-        ),
+        _fm(Path("/test/IMG_1234.jpg"), ts=datetime(2023, 10, 15, 12, tzinfo=timezone.utc),
+            src="EXIF DateTimeOriginal"),
+        _fm(Path("/test/IMG_5678.jpg"), ts=datetime(2023, 10, 15, 14, tzinfo=timezone.utc),
+            src="EXIF DateTimeOriginal"),
     ]
 
 
@@ -129,6 +218,13 @@ class TestConstants:
     def test_allowed_suffixes_is_union(self):
         assert ALLOWED_SUFFIXES == IMG_FORMATS | VIDEO_FORMATS
 
+    def test_suffix_re_matches_allowed_suffixes_only(self):
+        for suffix in ALLOWED_SUFFIXES:
+            assert SUFFIX_RE.search(f"IMG_0001{suffix}")
+            assert SUFFIX_RE.search(f"IMG_0001{suffix.upper()}")
+        for name in ("notes.txt", "IMG_0001.jpg.bak", "IMG_0001.jpg\n", "IMG_0001jpg", "mov"):
+            assert not SUFFIX_RE.search(name)
+
     def test_max_workers_is_positive(self):
         assert MAX_WORKERS > 0
         assert isinstance(MAX_WORKERS, int)
@@ -138,6 +234,17 @@ class TestConstants:
         for pattern in PATTERNS_TO_RENAME:
             assert hasattr(pattern, 'search')
 
+    def test_combined_pattern_matches_first_applicable_pattern(self):
+        names = ["IMG_1234.jpg", "IMG_E5678 (1).jpg", "12345_6.mp4", "ABCD1234.jpg",
+                 "BulkPics 12.png", "P1234567.jpg", "20231015-3 beach.jpg",
+                 "holiday.jpg", "x_IMG_1234.jpg"]
+        for name in names:
+            expected = next((p.search(name) for p in PATTERNS_TO_RENAME if p.search(name)), None)
+            match = COMBINED_PATTERN.match(name)
+            assert (match is None) == (expected is None)
+            if match:
+                assert match.end() == expected.end()
+
     def test_dest_pattern_compiled(self):
         assert hasattr(DEST_PATTERN, 'search')
         match = DEST_PATTERN.search("20231015-0.jpg")
@@ -155,7 +262,7 @@ class TestFileMetadata:
     def test_create_with_required_fields(self):
         fm = FileMetadata(
             original_path=Path("/test/file.jpg"),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_NOW,
             extension=".jpg",
             original_name="file.jpg",
             metadata_reliable=True,
@@ -164,10 +271,23 @@ class TestFileMetadata:
         assert fm.was_converted is False
         assert fm.skip_reason is None
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self):
+        fm = FileMetadata(
+            original_path=Path("/test/file.jpg"),
+            timestamp=_NOW,
+            extension=".jpg",
+            original_name="file.jpg",
+            metadata_reliable=True,
+            timestamp_source="EXIF",
+        )
+        assert not hasattr(fm, "__dict__")
+        assert not hasattr(ProcessingStats(), "__dict__")
+
     def test_create_with_all_fields(self):
         fm = FileMetadata(
             original_path=Path("/test/file.jpg"),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_NOW,
             extension=".jpg",
             original_name="file.jpg",
             metadata_reliable=True,
@@ -181,7 +301,7 @@ class TestFileMetadata:
     def test_mutable_fields(self):
         fm = FileMetadata(
             original_path=Path("/test/file.jpg"),
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_NOW,
             extension=".jpg",
             original_name="file.jpg",
             metadata_reliable=True,
@@ -251,8 +371,29 @@ class TestSetupLogger:
         handler_types = [type(h).__name__ for h in logger.handlers]
         assert "TimedRotatingFileHandler" in handler_types
         assert "StreamHandler" in handler_types
+        assert logger.propagate is False
         logger.handlers.clear()
 
+    def test_bulk_mode_buffers_file_output(self, tmp_path, capsys):
+        os.chdir(tmp_path)
+        logging.getLogger("bulk_rename.main").handlers.clear()
+        logger = setup_logger("test_script", bulk=True)
+        memory_handler, console_handler = logger.handlers
+        file_handler = memory_handler.target
+        try:
+            assert isinstance(memory_handler, MemoryHandler)
+            assert isinstance(file_handler, TimedRotatingFileHandler)
+            logger.info("buffered")
+            # Only the log file is buffered; the console still shows INFO output
+            assert "buffered" in capsys.readouterr().out
+            assert (tmp_path / "test_script.log").read_text(encoding="utf-8") == ""
+            memory_handler.flush()
+            assert "buffered" in (tmp_path / "test_script.log").read_text(encoding="utf-8")
+        finally:
+            memory_handler.close()
+            file_handler.close()
+            logger.handlers.clear()
+
 
 # =============================================================================
 # Tests for rename_file
@@ -261,9 +402,8 @@ class TestSetupLogger:
 class TestRenameFile:
     """Test rename_file function."""
 
-    def test_skip_same_path(self, mock_logger, tmp_path):
-        src = tmp_path / "test.jpg"
-        src.write_bytes(b"test")
+    def test_skip_same_path(self, mock_logger, mkfile):
+        src = mkfile("test.jpg", b"test")
         result = rename_file(src, src, commit=True, logger=mock_logger)
         assert result is False
         mock_logger.info.assert_called()
@@ -274,8 +414,7 @@ class TestRenameFile:
         src.write_bytes(b"test")
         result = rename_file(src, dst, commit=False, logger=mock_logger)
         assert result is True
-        assert src.exists()  # File not actually renamed
-        assert not dst.exists()
+        assert _ls(tmp_path) == {"src.jpg"}  # File not actually renamed
 
     def test_commit_renames_file(self, mock_logger, tmp_path):
         src = tmp_path / "src.jpg"
@@ -283,8 +422,7 @@ class TestRenameFile:
         src.write_bytes(b"test")
         result = rename_file(src, dst, commit=True, logger=mock_logger)
         assert result is True
-        assert not src.exists()
-        assert dst.exists()
+        assert _ls(tmp_path) == {"dst.jpg"}
 
     def test_commit_handles_error(self, mock_logger, tmp_path):
         src = tmp_path / "nonexistent.jpg"
@@ -301,19 +439,88 @@ class TestRenameFile:
 class TestFallbackTimestamp:
     """Test fallback_timestamp function."""
 
-    def test_returns_datetime(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_returns_datetime(self, mock_logger, shared_mkfile):
+        test_file = shared_mkfile("test.jpg", b"test")
         result = fallback_timestamp(test_file, mock_logger)
         assert isinstance(result, datetime)
         assert result.tzinfo == timezone.utc
 
-    def test_logs_debug(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_logs_debug(self, mock_logger, shared_mkfile):
+        test_file = shared_mkfile("test.jpg", b"test")
         fallback_timestamp(test_file, mock_logger)
         mock_logger.debug.assert_called()
 
+    def test_uses_known_mtime_without_stat(self, mock_logger):
+        with patch("bulk_rename.main.Path.stat") as mock_stat:
+            result = fallback_timestamp(Path("/missing.jpg"), mock_logger, mtime=1234567890.0)
+        mock_stat.assert_not_called()
+        assert result == datetime.fromtimestamp(1234567890.0).astimezone(timezone.utc)
+
+
+# =============================================================================
+# Tests for _parse_exif_datetime
+# =============================================================================
+
+class TestParseExifDatetime:
+    """Test _parse_exif_datetime function."""
+
+    def test_parses_fixed_width_timestamp(self):
+        result = _parse_exif_datetime("2023:10:15 12:34:56")
+        assert result == datetime(2023, 10, 15, 12, 34, 56, tzinfo=timezone.utc)
+
+    def test_zero_date_raises(self):
+        with pytest.raises(ValueError):
+            _parse_exif_datetime("0000:00:00 00:00:00")
+
+    def test_blank_fields_raise(self):
+        with pytest.raises(ValueError):
+            _parse_exif_datetime("    :  :     :  :  ")
+
+    def test_other_formats_raise(self):
+        with pytest.raises(ValueError):
+            _parse_exif_datetime("2023-10-15T12:34:56")
+
+
+# =============================================================================
+# Tests for _fast_stat_mtime
+# =============================================================================
+
+class TestFastStatMtime:
+    """Test _fast_stat_mtime and its statx lookup."""
+
+    @pytest.fixture(autouse=True)
+    def clear_statx_cache(self):
+        _libc_statx.cache_clear()
+        yield
+        _libc_statx.cache_clear()
+
+    def test_matches_os_stat(self, shared_mkfile):
+        test_file = shared_mkfile("test.jpg", b"test")
+        assert _fast_stat_mtime(test_file) == pytest.approx(os.stat(test_file).st_mtime)
+
+    def test_falls_back_to_os_stat_without_statx(self, shared_mkfile):
+        test_file = shared_mkfile("test.jpg", b"test")
+        with patch("bulk_rename.main._libc_statx", return_value=None):
+            assert _fast_stat_mtime(test_file) == os.stat(test_file).st_mtime
+
+    def test_falls_back_when_mtime_not_returned(self, shared_mkfile):
+        test_file = shared_mkfile("test.jpg", b"test")
+        with patch("bulk_rename.main._libc_statx", return_value=Mock(return_value=0)):
+            assert _fast_stat_mtime(test_file) == os.stat(test_file).st_mtime
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _fast_stat_mtime(tmp_path / "missing.jpg")
+
+    def test_no_statx_off_linux(self):
+        with patch("bulk_rename.main.sys.platform", "win32"):
+            assert _libc_statx() is None
+
+    def test_no_statx_in_libc(self):
+        with patch("bulk_rename.main.sys.platform", "linux"):
+            with patch("bulk_rename.main.ctypes.CDLL", side_effect=OSError("no libc")):
+                assert _libc_statx() is None
+
 
 # =============================================================================
 # Tests for extract_exif_timestamp
@@ -348,9 +555,28 @@ class TestExtractExifTimestamp:
             assert result == datetime(2023, 10, 15, 12, 30, 45, tzinfo=timezone.utc)
             assert source == "EXIF DateTime"
 
-    def test_no_exif_uses_fallback(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_unidentified_image_logs_expected_mime_type(self, mock_logger, mkfile):
+        test_file = mkfile("broken.JPG", b"test")
+        with patch("bulk_rename.main._read_exif_datetime",
+                   side_effect=UnidentifiedImageError("bad image")):
+            extract_exif_timestamp(test_file, mock_logger)
+        diagnostics = [c for c in mock_logger.debug.call_args_list
+                       if "may be corrupted" in c[0][0]]
+        assert diagnostics[0][0][1:] == ("broken.JPG", 4, "image/jpeg")
+
+    def test_skips_debug_diagnostics_when_debug_disabled(self):
+        logger = logging.getLogger("test_bulk_rename.info_only")
+        logger.setLevel(logging.INFO)
+        missing = Path("/nonexistent/broken.jpg")
+        with patch("bulk_rename.main._read_exif_datetime",
+                   side_effect=UnidentifiedImageError("bad image")):
+            # A stat of the missing file would raise, so none may happen
+            result, source = extract_exif_timestamp(missing, logger, mtime=1234567890.0)
+        assert source == "fallback"
+        assert result == datetime.fromtimestamp(1234567890.0).astimezone(timezone.utc)
+
+    def test_no_exif_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
         mock_exif = {}
         with patch("bulk_rename.main.Image.open") as mock_open:
             mock_img = MagicMock()
@@ -363,9 +589,40 @@ class TestExtractExifTimestamp:
             assert isinstance(result, datetime)
             assert source == "fallback"
 
-    def test_unidentified_image_uses_fallback(self, mock_logger, tmp_path):
+    def test_empty_exif_timestamp_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
+        with patch("bulk_rename.main.Image.open") as mock_open:
+            mock_img = MagicMock()
+            mock_img.getexif.return_value = {306: ""}
+            mock_img.__enter__ = Mock(return_value=mock_img)
+            mock_img.__exit__ = Mock(return_value=False)
+            mock_open.return_value = mock_img
+
+            _result, source = extract_exif_timestamp(test_file, mock_logger)
+        assert source == "fallback"
+
+    def test_no_exif_reads_mtime_from_open_file(self, mock_logger, tmp_path):
         test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+        Image.new("RGB", (1, 1)).save(test_file, "JPEG")
+        os.utime(test_file, (1234567890.0, 1234567890.0))
+
+        with patch("bulk_rename.main._fast_stat_mtime") as mock_stat:
+            result, source = extract_exif_timestamp(test_file, mock_logger)
+        mock_stat.assert_not_called()
+        assert source == "fallback"
+        assert result == datetime.fromtimestamp(1234567890.0).astimezone(timezone.utc)
+
+    def test_no_exif_stats_when_file_already_closed(self, mock_logger, tmp_path):
+        test_file = tmp_path / "test.png"
+        Image.new("RGB", (1, 1)).save(test_file, "PNG")
+        os.utime(test_file, (1234567890.0, 1234567890.0))
+
+        result, source = extract_exif_timestamp(test_file, mock_logger)
+        assert source == "fallback"
+        assert result == datetime.fromtimestamp(1234567890.0).astimezone(timezone.utc)
+
+    def test_unidentified_image_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
 
         with patch("bulk_rename.main.Image.open") as mock_open:
             mock_open.side_effect = UnidentifiedImageError("test")
@@ -374,9 +631,8 @@ class TestExtractExifTimestamp:
             assert source == "fallback"
             mock_logger.error.assert_called()
 
-    def test_os_error_uses_fallback(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_os_error_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
 
         with patch("bulk_rename.main.Image.open") as mock_open:
             mock_open.side_effect = OSError("test")
@@ -385,6 +641,151 @@ class TestExtractExifTimestamp:
             assert source == "fallback"
 
 
+def _jpeg_with_exif(date_original=None, date_time=None):
+    """Encode a tiny JPEG whose EXIF holds the given timestamps."""
+    exif = Image.Exif()
+    if date_time:
+        exif[306] = date_time
+    if date_original:
+        exif.get_ifd(0x8769)[36867] = date_original
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8)).save(buffer, "JPEG", exif=exif)
+    return buffer.getvalue()
+
+
+def _little_endian_tiff(date_time):
+    """Hand-build a little-endian TIFF block with only an IFD0 DateTime tag."""
+    value = date_time.encode("ascii") + b"\x00"
+    ifd = struct.pack("<H", 1) + struct.pack("<HHII", 306, 2, len(value), 26) + b"\x00" * 4
+    return b"II*\x00" + struct.pack("<I", 8) + ifd + value
+
+
+class TestReadApp1Exif:
+    """Test the EXIF header fast path used by extract_exif_timestamp."""
+
+    def test_reads_datetime_original_from_exif_ifd(self, shared_mkfile):
+        image = shared_mkfile("test.jpg",
+                              _jpeg_with_exif("2023:10:15 12:30:45", "2024:01:01 00:00:00"))
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTimeOriginal")
+
+    def test_reads_datetime_from_ifd0(self, shared_mkfile):
+        image = shared_mkfile("test.jpg", _jpeg_with_exif(date_time="2023:10:15 12:30:45"))
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTime")
+
+    def test_jpeg_without_exif(self, shared_mkfile):
+        image = shared_mkfile("test.jpg", _jpeg_with_exif())
+        assert _read_app1_exif(image) is None
+
+    def test_jpeg_with_fill_bytes_and_non_exif_app1(self, tmp_path):
+        image = tmp_path / "test.jpg"
+        xmp = b"http://ns.adobe.com/xap/1.0/\x00"
+        app1_xmp = b"\xff\xe1" + struct.pack(">H", len(xmp) + 2) + xmp
+        jpeg = _jpeg_with_exif(date_time="2023:10:15 12:30:45")
+        image.write_bytes(jpeg[:2] + b"\xff" + app1_xmp + jpeg[2:])
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTime")
+
+    def test_exif_after_large_app2_segment(self, tmp_path):
+        image = tmp_path / "test.jpg"
+        icc = b"ICC_PROFILE\x00" + b"\x00" * 65000
+        app2 = b"\xff\xe2" + struct.pack(">H", len(icc) + 2) + icc
+        jpeg = _jpeg_with_exif(date_time="2023:10:15 12:30:45")
+        image.write_bytes(jpeg[:2] + app2 + jpeg[2:])
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTime")
+
+    def test_png_exif_chunk(self, tmp_path):
+        image = tmp_path / "test.png"
+        exif = Image.Exif()
+        exif[306] = "2023:10:15 12:30:45"
+        Image.new("RGB", (8, 8)).save(image, "PNG", exif=exif)
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTime")
+
+    def test_png_without_exif_stops_at_image_data(self, tmp_path):
+        image = tmp_path / "test.png"
+        Image.new("RGB", (8, 8)).save(image, "PNG")
+        assert _read_app1_exif(image) is None
+
+    def test_truncated_png(self, shared_mkfile):
+        image = shared_mkfile("test.png", b"\x89PNG\r\n\x1a\n\x00\x00\x00\x0dIHDR")
+        assert _read_app1_exif(image) is None
+
+    def test_corrupt_jpeg_segments(self, shared_mkfile):
+        image = shared_mkfile("test.jpg", b"\xff\xd8\x00\x00\x00\x00")
+        assert _read_app1_exif(image) is None
+
+    def test_stops_at_start_of_scan(self, shared_mkfile):
+        image = shared_mkfile("test.jpg",
+                              b"\xff\xd8\xff\xda\x00\x08" + _jpeg_with_exif(date_time="2023"))
+        assert _read_app1_exif(image) is None
+
+    def test_header_shorter_than_segment(self, shared_mkfile):
+        image = shared_mkfile("test.jpg", b"\xff\xd8\xff\xe0\x00\x10JF")
+        assert _read_app1_exif(image) is None
+
+    def test_ignores_non_ascii_timestamp(self, tmp_path):
+        image = tmp_path / "test.heic"
+        tiff = bytearray(_little_endian_tiff("2023:10:15 12:30:45"))
+        tiff[12:14] = struct.pack("<H", 7)  # UNDEFINED instead of ASCII
+        image.write_bytes(b"Exif\x00\x00" + bytes(tiff))
+        assert _read_app1_exif(image) is None
+
+    def test_heic_style_exif_block_skips_decoy(self, tmp_path):
+        image = tmp_path / "test.heic"
+        decoy = b"infe\x00\x00\x00\x01Exif\x00\x00\x00\x00\x15"
+        block = b"\x00\x00\x00\x06Exif\x00\x00" + _little_endian_tiff("2023:10:15 12:30:45")
+        image.write_bytes(b"\x00\x00\x00\x18ftypheic" + decoy + b"mdat" + block)
+        assert _read_app1_exif(image) == ("2023:10:15 12:30:45", "EXIF DateTime")
+
+    def test_truncated_block_returns_none(self, shared_mkfile):
+        image = shared_mkfile("test.heic", b"Exif\x00\x00MM\x00*\x00\x00\xff\xff")
+        assert _read_app1_exif(image) is None
+
+    def test_value_outside_block_returns_none(self, shared_mkfile):
+        tiff = _little_endian_tiff("2023:10:15 12:30:45")[:-10]
+        image = shared_mkfile("test.heic", b"Exif\x00\x00" + tiff)
+        assert _read_app1_exif(image) is None
+
+    def test_missing_file_returns_none(self, tmp_path):
+        assert _read_app1_exif(tmp_path / "missing.jpg") is None
+
+    def test_fast_path_skips_pillow(self, mock_logger, shared_mkfile):
+        image = shared_mkfile("test.jpg", _jpeg_with_exif("2023:10:15 12:30:45"))
+        with patch("bulk_rename.main.Image.open") as mock_open:
+            result, source = extract_exif_timestamp(image, mock_logger)
+            mock_open.assert_not_called()
+        assert result == datetime(2023, 10, 15, 12, 30, 45, tzinfo=timezone.utc)
+        assert source == "EXIF DateTimeOriginal"
+
+
+class TestExtractImageMeta:
+    """Test _extract_image_meta process-pool worker."""
+
+    def test_returns_exif_timestamp(self):
+        with patch("bulk_rename.main.Image.open") as mock_open:
+            mock_img = MagicMock()
+            mock_img.getexif.return_value = {306: "2023:10:15 12:30:45"}
+            mock_img.__enter__ = Mock(return_value=mock_img)
+            mock_img.__exit__ = Mock(return_value=False)
+            mock_open.return_value = mock_img
+
+            result = _extract_image_meta("/test.jpg")
+        assert result == (
+            "/test.jpg",
+            datetime(2023, 10, 15, 12, 30, 45, tzinfo=timezone.utc),
+            "EXIF DateTime",
+            None,
+            None,
+        )
+
+    def test_returns_error_instead_of_raising(self):
+        error = UnidentifiedImageError("test")
+        with patch("bulk_rename.main.Image.open", side_effect=error):
+            path_str, exif_dt, _source, result_error, mtime = _extract_image_meta("/test.jpg")
+        assert path_str == "/test.jpg"
+        assert exif_dt is None
+        assert result_error is error
+        assert mtime is None
+
+
 # =============================================================================
 # Tests for extract_video_timestamp
 # =============================================================================
@@ -392,13 +793,14 @@ class TestExtractExifTimestamp:
 class TestExtractVideoTimestamp:
     """Test extract_video_timestamp function."""
 
-    def test_propsys_success(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+    def test_propsys_success(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
         expected_dt = datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
 
         # Mock both WINDOWS_AVAILABLE and propsys for cross-platform testing
-        with patch("bulk_rename.main.WINDOWS_AVAILABLE", True):
+        with patch("bulk_rename.main.WINDOWS_AVAILABLE", True), \
+                patch("bulk_rename.main.pythoncom"), \
+                patch("bulk_rename.main._com_state", threading.local()):
             with patch("bulk_rename.main.propsys") as mock_propsys_module:
                 mock_props = MagicMock()
                 mock_value = MagicMock()
@@ -414,9 +816,30 @@ class TestExtractVideoTimestamp:
                     assert result == expected_dt
                     assert source == "propsys"
 
-    def test_propsys_fails_ffprobe_success(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+    def test_propsys_falls_through_to_next_key(self, mock_logger, mkfile):
+        test_file = mkfile("test.mov", b"test")
+        expected_dt = datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
+        values = {"encoded": None, "taken": expected_dt}
+
+        with patch("bulk_rename.main.WINDOWS_AVAILABLE", True), \
+                patch("bulk_rename.main.pythoncom"), \
+                patch("bulk_rename.main._com_state", threading.local()), \
+                patch("bulk_rename.main.propsys") as mock_propsys_module, \
+                patch("bulk_rename.main.pscon") as mock_pscon:
+            mock_pscon.PKEY_Media_DateEncoded = "encoded"
+            mock_pscon.PKEY_Photo_DateTaken = "taken"
+            mock_props = mock_propsys_module.SHGetPropertyStoreFromParsingName.return_value
+            mock_props.GetValue.side_effect = lambda key: Mock(GetValue=Mock(
+                return_value=values[key]))
+
+            result, source = extract_video_timestamp(test_file, mock_logger)
+
+        assert result == expected_dt
+        assert source == "propsys"
+        mock_propsys_module.SHGetPropertyStoreFromParsingName.assert_called_once()
+
+    def test_propsys_fails_ffprobe_success(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
 
         # Mock WINDOWS_AVAILABLE and propsys for cross-platform testing
         with patch("bulk_rename.main.WINDOWS_AVAILABLE", True):
@@ -430,17 +853,20 @@ class TestExtractVideoTimestamp:
 
                     ffprobe_output = json.dumps({
                         "format": {"tags": {"creation_time": "2023-10-15T12:00:00Z"}}
-                    })
+                    }).encode()
                     with patch("bulk_rename.main.subprocess.run") as mock_run:
                         mock_run.return_value = MagicMock(stdout=ffprobe_output, returncode=0)
 
                         result, source = extract_video_timestamp(test_file, mock_logger)
                         assert result == datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
                         assert source == "ffprobe"
+                        argv = mock_run.call_args[0][0]
+                        assert argv[argv.index("-probesize") + 1] == "32"
+                        assert argv[argv.index("-analyzeduration") + 1] == "0"
+                        assert argv[argv.index("-fflags") + 1] == "+fastseek"
 
-    def test_both_fail_uses_fallback(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+    def test_both_fail_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
 
         # Mock WINDOWS_AVAILABLE and propsys for cross-platform testing
         with patch("bulk_rename.main.WINDOWS_AVAILABLE", True):
@@ -453,15 +879,14 @@ class TestExtractVideoTimestamp:
                     mock_pscon.PKEY_Media_DateEncoded = "mock_key"
 
                     with patch("bulk_rename.main.subprocess.run") as mock_run:
-                        mock_run.return_value = MagicMock(stdout="{}", returncode=0)
+                        mock_run.return_value = MagicMock(stdout=b"{}", returncode=0)
 
                         result, source = extract_video_timestamp(test_file, mock_logger)
                         assert isinstance(result, datetime)
                         assert source == "fallback"
 
-    def test_ffprobe_with_offset_timestamp(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+    def test_ffprobe_with_offset_timestamp(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
 
         # Mock WINDOWS_AVAILABLE and propsys for cross-platform testing
         with patch("bulk_rename.main.WINDOWS_AVAILABLE", True):
@@ -475,24 +900,24 @@ class TestExtractVideoTimestamp:
 
                     ffprobe_output = json.dumps({
                         "format": {"tags": {"creation_time": "2023-10-15T12:00:00+05:00"}}
-                    })
+                    }).encode()
                     with patch("bulk_rename.main.subprocess.run") as mock_run:
                         mock_run.return_value = MagicMock(stdout=ffprobe_output, returncode=0)
 
                         result, source = extract_video_timestamp(test_file, mock_logger)
                         assert result.tzinfo == timezone.utc
+                        assert result == datetime(2023, 10, 15, 7, 0, 0, tzinfo=timezone.utc)
                         assert source == "ffprobe"
 
-    def test_non_windows_platform_uses_ffprobe(self, mock_logger, tmp_path):
+    def test_non_windows_platform_uses_ffprobe(self, mock_logger, mkfile):
         """Test that non-Windows platforms skip propsys and use ffprobe directly."""
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+        test_file = mkfile("test.mp4", b"test")
 
         # Mock WINDOWS_AVAILABLE as False to simulate non-Windows platform
         with patch("bulk_rename.main.WINDOWS_AVAILABLE", False):
             ffprobe_output = json.dumps({
                 "format": {"tags": {"creation_time": "2023-10-15T12:00:00Z"}}
-            })
+            }).encode()
             with patch("bulk_rename.main.subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(stdout=ffprobe_output, returncode=0)
 
@@ -505,6 +930,129 @@ class TestExtractVideoTimestamp:
                     test_file.name
                 )
 
+    def test_ffprobe_missing_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
+
+        with patch("bulk_rename.main.WINDOWS_AVAILABLE", False):
+            with patch("bulk_rename.main.subprocess.run",
+                       side_effect=FileNotFoundError("ffprobe")):
+                result, source = extract_video_timestamp(test_file, mock_logger)
+        assert isinstance(result, datetime)
+        assert source == "fallback"
+        mock_logger.warning.assert_called()
+
+    def test_ffprobe_empty_output_uses_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.mp4", b"test")
+
+        with patch("bulk_rename.main.WINDOWS_AVAILABLE", False):
+            with patch("bulk_rename.main.subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(stdout=b"", returncode=1)
+                _result, source = extract_video_timestamp(test_file, mock_logger)
+        assert source == "fallback"
+        assert mock_run.call_args[1]["stderr"] == subprocess.DEVNULL
+
+
+# =============================================================================
+# Tests for _ensure_com_initialized
+# =============================================================================
+
+class TestEnsureComInitialized:
+    """Test per-thread COM initialization."""
+
+    def test_initializes_once_per_thread(self):
+        with patch("bulk_rename.main.pythoncom") as mock_pythoncom, \
+                patch("bulk_rename.main._com_state", threading.local()):
+            _ensure_com_initialized()
+            _ensure_com_initialized()
+            mock_pythoncom.CoInitialize.assert_called_once()
+            mock_pythoncom.CoUninitialize.assert_not_called()
+
+    def test_uninitializes_when_thread_exits(self):
+        with patch("bulk_rename.main.pythoncom") as mock_pythoncom, \
+                patch("bulk_rename.main._com_state", threading.local()):
+            worker = threading.Thread(target=_ensure_com_initialized)
+            worker.start()
+            worker.join()
+            gc.collect()
+            mock_pythoncom.CoInitialize.assert_called_once()
+            mock_pythoncom.CoUninitialize.assert_called_once()
+
+
+# =============================================================================
+# Tests for extract_video_timestamps_batch
+# =============================================================================
+
+class TestExtractVideoTimestampsBatch:
+    """Test extract_video_timestamps_batch function."""
+
+    def test_empty_list_skips_exiftool(self, mock_logger):
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            assert not extract_video_timestamps_batch([], mock_logger)
+            mock_run.assert_not_called()
+
+    def test_exiftool_missing_returns_empty(self, mock_logger):
+        with patch("bulk_rename.main.shutil.which", return_value=None):
+            with patch("bulk_rename.main.subprocess.run") as mock_run:
+                assert not extract_video_timestamps_batch([Path("/v/a.mov")], mock_logger)
+                mock_run.assert_not_called()
+
+    def test_parses_single_invocation(self, mock_logger):
+        good = Path("/v/good.mov")
+        unset = Path("/v/unset.mp4")
+        missing = Path("/v/missing.m4v")
+        output = json.dumps([
+            {"SourceFile": good.resolve().as_posix(), "CreateDate": "2023:10:15 12:00:00"},
+            {"SourceFile": unset.resolve().as_posix(), "CreateDate": "0000:00:00 00:00:00"},
+            {"SourceFile": missing.resolve().as_posix()},
+            {"SourceFile": "/v/unknown.mov", "CreateDate": "2023:10:15 12:00:00"},
+        ])
+        with patch("bulk_rename.main.shutil.which", return_value="exiftool"):
+            with patch("bulk_rename.main.subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(stdout=output.encode(), returncode=0)
+                result = extract_video_timestamps_batch([good, unset, missing], mock_logger)
+                mock_run.assert_called_once()
+
+        assert mock_run.call_args[0][0] == ["exiftool", "-@", "-"]
+        arg_lines = mock_run.call_args[1]["input"].decode("utf-8").splitlines()
+        assert good.resolve().as_posix() in arg_lines
+        assert "-fast" in arg_lines
+        assert result == {
+            good: (datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc), "exiftool")
+        }
+
+    def test_relative_dash_names_are_written_absolute(self, mock_logger, tmp_path,
+                                                       monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        video = Path("-x.mov")
+        output = json.dumps([
+            {"SourceFile": (tmp_path / "-x.mov").resolve().as_posix(),
+             "CreateDate": "2023:10:15 12:00:00"},
+        ])
+        with patch("bulk_rename.main.shutil.which", return_value="exiftool"):
+            with patch("bulk_rename.main.subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(stdout=output.encode(), returncode=0)
+                result = extract_video_timestamps_batch([video], mock_logger)
+
+        arg_lines = mock_run.call_args[1]["input"].decode("utf-8").splitlines()
+        assert "-x.mov" not in arg_lines
+        assert (tmp_path / "-x.mov").resolve().as_posix() in arg_lines
+        assert result == {
+            video: (datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc), "exiftool")
+        }
+
+    def test_exiftool_failure_returns_empty(self, mock_logger):
+        with patch("bulk_rename.main.shutil.which", return_value="exiftool"):
+            with patch("bulk_rename.main.subprocess.run", side_effect=OSError("boom")):
+                assert not extract_video_timestamps_batch([Path("/v/a.mov")], mock_logger)
+                mock_logger.warning.assert_called()
+
+    def test_invalid_json_returns_empty(self, mock_logger):
+        with patch("bulk_rename.main.shutil.which", return_value="exiftool"):
+            with patch("bulk_rename.main.subprocess.run") as mock_run:
+                mock_run.return_value = MagicMock(stdout=b"not json", returncode=1)
+                assert not extract_video_timestamps_batch([Path("/v/a.mov")], mock_logger)
+                mock_logger.warning.assert_called()
+
 
 # =============================================================================
 # Tests for get_media_created_date_time
@@ -519,7 +1067,7 @@ class TestGetMediaCreatedDateTime:
             test_file.write_bytes(b"test")
 
             with patch("bulk_rename.main.extract_video_timestamp") as mock_extract:
-                mock_extract.return_value = (datetime.now(timezone.utc), "propsys")
+                mock_extract.return_value = (_NOW, "propsys")
                 get_media_created_date_time(test_file, mock_logger)
                 mock_extract.assert_called_once()
 
@@ -529,7 +1077,7 @@ class TestGetMediaCreatedDateTime:
             test_file.write_bytes(b"test")
 
             with patch("bulk_rename.main.extract_exif_timestamp") as mock_extract:
-                mock_extract.return_value = (datetime.now(timezone.utc), "EXIF")
+                mock_extract.return_value = (_NOW, "EXIF")
                 get_media_created_date_time(test_file, mock_logger)
                 mock_extract.assert_called()
 
@@ -541,37 +1089,45 @@ class TestGetMediaCreatedDateTime:
 class TestExtractSingleFileMetadata:
     """Test _extract_single_file_metadata function."""
 
-    def test_returns_none_for_unsupported_suffix(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.txt"
-        test_file.write_bytes(b"test")
+    def test_returns_none_for_unsupported_suffix(self, mock_logger, mkfile):
+        test_file = mkfile("test.txt", b"test")
         result = _extract_single_file_metadata(test_file, mock_logger)
         assert result is None
 
-    def test_returns_metadata_for_supported_suffix(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_returns_metadata_for_supported_suffix(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "EXIF")
+            mock_get.return_value = (_NOW, "EXIF")
             result = _extract_single_file_metadata(test_file, mock_logger)
             assert isinstance(result, FileMetadata)
             assert result.extension == ".jpg"
 
-    def test_metadata_reliable_for_exif(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_metadata_reliable_for_exif(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "EXIF DateTimeOriginal")
+            mock_get.return_value = (_NOW, "EXIF DateTimeOriginal")
             result = _extract_single_file_metadata(test_file, mock_logger)
             assert result.metadata_reliable is True
 
-    def test_metadata_unreliable_for_fallback(self, mock_logger, tmp_path):
-        test_file = tmp_path / "test.jpg"
-        test_file.write_bytes(b"test")
+    def test_uses_known_timestamp(self, mock_logger, mkfile):
+        test_file = mkfile("test.mov", b"test")
+        known_dt = datetime(2023, 10, 15, tzinfo=timezone.utc)
+
+        with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
+            result = _extract_single_file_metadata(
+                test_file, mock_logger, {test_file: (known_dt, "exiftool")}
+            )
+            mock_get.assert_not_called()
+        assert result.timestamp == known_dt
+        assert result.metadata_reliable is True
+
+    def test_metadata_unreliable_for_fallback(self, mock_logger, mkfile):
+        test_file = mkfile("test.jpg", b"test")
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "fallback")
+            mock_get.return_value = (_NOW, "fallback")
             result = _extract_single_file_metadata(test_file, mock_logger)
             assert result.metadata_reliable is False
 
@@ -591,10 +1147,94 @@ class TestCollectFileMetadata:
             files.append(f)
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "EXIF")
+            mock_get.return_value = (_NOW, "EXIF")
             result = collect_file_metadata(files, mock_logger)
             assert len(result) == 5
 
+    def test_images_keep_scanned_path_objects(self, mock_logger, mkfile):
+        image = mkfile("IMG_0001.jpg", _jpeg_with_exif("2023:10:15 12:30:45"))
+
+        result = collect_file_metadata([image], mock_logger)
+
+        assert result[0].original_path is image
+        assert result[0].timestamp_source == "EXIF DateTimeOriginal"
+
+    def test_returns_entries_sorted_by_timestamp(self, mock_logger, tmp_path):
+        stamps = {
+            "VD_0001.mp4": datetime(2023, 10, 17, tzinfo=timezone.utc),
+            "VD_0002.mp4": datetime(2023, 10, 15, tzinfo=timezone.utc),
+            "VD_0003.mp4": datetime(2023, 10, 15, tzinfo=timezone.utc),
+        }
+        files = [tmp_path / name for name in stamps]
+
+        with patch("bulk_rename.main.extract_video_timestamps_batch", return_value={}), \
+                patch("bulk_rename.main.get_media_created_date_time",
+                      side_effect=lambda f, *_args: (stamps[f.name], "ffprobe")):
+            result = collect_file_metadata(files, mock_logger)
+
+        assert [m.original_name for m in result] == ["VD_0002.mp4", "VD_0003.mp4", "VD_0001.mp4"]
+
+    def test_passes_lowercased_suffix_to_workers(self, mock_logger, tmp_path):
+        video = tmp_path / "VD_0001.MOV"
+
+        with patch("bulk_rename.main.extract_video_timestamps_batch", return_value={}), \
+                patch("bulk_rename.main.get_media_created_date_time",
+                      return_value=(_NOW, "ffprobe")) as mock_get:
+            result = collect_file_metadata([video], mock_logger)
+
+        mock_get.assert_called_once_with(video, mock_logger, None, ".mov")
+        assert result[0].extension == ".mov"
+
+    def test_batches_videos_without_propsys(self, mock_logger, tmp_path):
+        video = tmp_path / "VD_0001.mov"
+        image = tmp_path / "IMG_0001.jpg"
+        video.write_bytes(b"test")
+        image.write_bytes(b"test")
+        video_dt = datetime(2023, 10, 15, tzinfo=timezone.utc)
+
+        with patch("bulk_rename.main.WINDOWS_AVAILABLE", False):
+            with patch("bulk_rename.main.extract_video_timestamps_batch") as mock_batch:
+                mock_batch.return_value = {video: (video_dt, "exiftool")}
+                with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
+                    result = collect_file_metadata([video, image], mock_logger)
+                    mock_get.assert_not_called()
+                mock_batch.assert_called_once_with([video], mock_logger)
+
+        by_name = {m.original_name: m for m in result}
+        assert by_name["VD_0001.mov"].timestamp_source == "exiftool"
+
+    def test_images_read_in_process_pool(self, mock_logger, tmp_path, mkfile):
+        image = tmp_path / "IMG_0001.jpg"
+        exif = Image.Exif()
+        exif[36867] = "2023:10:15 12:30:45"
+        Image.new("RGB", (8, 8)).save(image, "JPEG", exif=exif)
+        corrupt = mkfile("IMG_0002.jpg", b"not an image")
+
+        result = collect_file_metadata([image, corrupt], mock_logger)
+
+        by_name = {m.original_name: m for m in result}
+        assert by_name["IMG_0001.jpg"].timestamp == datetime(
+            2023, 10, 15, 12, 30, 45, tzinfo=timezone.utc
+        )
+        assert by_name["IMG_0001.jpg"].metadata_reliable is True
+        assert by_name["IMG_0002.jpg"].timestamp_source == "fallback"
+        mock_logger.error.assert_called()
+
+    def test_image_pool_uses_chunked_map(self, mock_logger, tmp_path):
+        images = [tmp_path / f"IMG_{i:04d}.jpg" for i in range(40)]
+        exif_dt = datetime(2023, 10, 15, tzinfo=timezone.utc)
+
+        with patch("bulk_rename.main.os.cpu_count", return_value=2), \
+                patch("bulk_rename.main.ProcessPoolExecutor") as mock_pool_cls:
+            pool = mock_pool_cls.return_value.__enter__.return_value
+            pool.map.side_effect = lambda fn, paths, chunksize: [
+                (p, exif_dt, "EXIF DateTimeOriginal", None, None) for p in paths]
+            result = collect_file_metadata(images, mock_logger)
+
+        mock_pool_cls.assert_called_once_with(max_workers=2)
+        assert pool.map.call_args[1]["chunksize"] == 5
+        assert len(result) == 40
+
     def test_filters_unsupported_files(self, mock_logger, tmp_path):
         jpg_file = tmp_path / "test.jpg"
         txt_file = tmp_path / "test.txt"
@@ -602,7 +1242,7 @@ class TestCollectFileMetadata:
         txt_file.write_bytes(b"test")
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "EXIF")
+            mock_get.return_value = (_NOW, "EXIF")
             result = collect_file_metadata([jpg_file, txt_file], mock_logger)
             assert len(result) == 1
 
@@ -614,6 +1254,11 @@ class TestCollectFileMetadata:
 class TestConvertHeicToJpg:
     """Test convert_heic_to_jpg function."""
 
+    @pytest.fixture(autouse=True)
+    def without_heif(self):
+        with patch("bulk_rename.main.HEIF_AVAILABLE", False):
+            yield
+
     def test_skip_if_dst_exists(self, mock_logger, tmp_path):
         src = tmp_path / "test.heic"
         dst = tmp_path / "test.jpg"
@@ -623,12 +1268,12 @@ class TestConvertHeicToJpg:
         result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
         assert result == dst
 
-    def test_dry_run_returns_dst_path(self, mock_logger, tmp_path):
-        src = tmp_path / "test.heic"
-        src.write_bytes(b"heic")
+    def test_dry_run_returns_dst_path(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.heic", b"heic")
 
         result = convert_heic_to_jpg(src, commit=False, logger=mock_logger)
         assert result == tmp_path / "test.jpg"
+        assert not result.exists()  # dry runs reserve nothing
         mock_logger.info.assert_called()
 
     def test_commit_calls_magick(self, mock_logger, tmp_path):
@@ -647,15 +1292,15 @@ class TestConvertHeicToJpg:
                 mock_run.assert_called_once()
                 mock_trash.assert_called_once()
 
-    def test_commit_handles_conversion_failure(self, mock_logger, tmp_path):
-        src = tmp_path / "test.heic"
-        src.write_bytes(b"heic")
+    def test_commit_handles_conversion_failure(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.heic", b"heic")
 
         with patch("bulk_rename.main.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "magick")
             result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
             assert result is None
             mock_logger.error.assert_called()
+        assert not (tmp_path / "test.jpg").exists()
 
     def test_handles_trash_failure(self, mock_logger, tmp_path):
         src = tmp_path / "test.heic"
@@ -673,15 +1318,240 @@ class TestConvertHeicToJpg:
                 assert result == dst
                 mock_logger.error.assert_called()
 
-    def test_dst_not_created_after_conversion(self, mock_logger, tmp_path):
-        src = tmp_path / "test.heic"
-        src.write_bytes(b"heic")
+    def test_dst_not_created_after_conversion(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.heic", b"heic")
 
         with patch("bulk_rename.main.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=0)
             # Don't create dst file
             result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
             assert result is None
+        assert not (tmp_path / "test.jpg").exists()  # placeholder removed
+
+    def test_output_reserved_before_magick_runs(self, mock_logger, tmp_path):
+        src = tmp_path / "test.heic"
+        dst = tmp_path / "test.jpg"
+        src.write_bytes(b"heic")
+        reserved = []
+
+        def convert(*_args, **_kwargs):
+            reserved.append(dst.exists())
+            dst.write_bytes(b"jpg")
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=convert):
+            with patch("bulk_rename.main.send2trash"):
+                assert convert_heic_to_jpg(src, commit=True, logger=mock_logger) == dst
+        assert reserved == [True]
+
+    @pytest.mark.parametrize("commit", [True, False], ids=["commit", "dry-run"])
+    def test_stale_empty_output_is_reconverted(self, mock_logger, tmp_path, commit):
+        src, dst = _mkfiles(tmp_path, [("test.heic", b"heic"), ("test.jpg", b"")])
+
+        def create_dst(*_args, **_kwargs):
+            dst.write_bytes(b"jpg")
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=create_dst) as mock_run:
+            with patch("bulk_rename.main.send2trash"):
+                assert convert_heic_to_jpg(src, commit=commit, logger=mock_logger) == dst
+        assert mock_run.called is commit
+        mock_logger.info.assert_any_call("Converting %s to %s", "test.heic", "test.jpg")
+
+
+# =============================================================================
+# Tests for convert_heic_batch
+# =============================================================================
+
+class TestConvertHeicBatch:
+    """Test convert_heic_batch function."""
+
+    @pytest.fixture(autouse=True)
+    def without_heif(self):
+        with patch("bulk_rename.main.HEIF_AVAILABLE", False):
+            yield
+
+    def test_dry_run_maps_all_files(self, mock_logger, tmp_path):
+        src1 = tmp_path / "a.heic"
+        src2 = tmp_path / "b.heic"
+        src1.write_bytes(b"heic")
+        src2.write_bytes(b"heic")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            result = convert_heic_batch([src1, src2], commit=False, logger=mock_logger)
+            mock_run.assert_not_called()
+        assert result == {src1: tmp_path / "a.jpg", src2: tmp_path / "b.jpg"}
+
+    def test_skips_existing_dst(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("a.heic", b"heic")
+        (tmp_path / "a.jpg").write_bytes(b"jpg")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            result = convert_heic_batch([src], commit=True, logger=mock_logger)
+            mock_run.assert_not_called()
+        assert result == {src: tmp_path / "a.jpg"}
+
+    def test_stale_empty_dst_is_reconverted(self, mock_logger, tmp_path):
+        src, dst = _mkfiles(tmp_path, [("a.heic", b"heic"), ("a.jpg", b"")])
+
+        def mogrify(*_args, **_kwargs):
+            dst.write_bytes(b"jpg")
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=mogrify) as mock_run:
+            with patch("bulk_rename.main.send2trash"):
+                result = convert_heic_batch([src], commit=True, logger=mock_logger)
+        mock_run.assert_called_once()
+        assert result == {src: dst}
+        assert dst.read_bytes() == b"jpg"
+
+    def test_commit_runs_single_mogrify(self, mock_logger, tmp_path):
+        sources = [tmp_path / f"IMG_{i}.heic" for i in range(3)]
+        for src in sources:
+            src.write_bytes(b"heic")
+        listed = []
+
+        def mogrify(cmd, **_kwargs):
+            list_path = Path(cmd[-1][1:])
+            listed.append(list_path.read_text(encoding="utf-8"))
+            for src in sources:
+                src.with_suffix(".jpg").write_bytes(b"jpg")
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=mogrify) as mock_run:
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_heic_batch(sources, commit=True, logger=mock_logger)
+                mock_run.assert_called_once()
+                assert mock_trash.call_count == 3
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["magick", "mogrify", "-format"]
+        assert "heic:preserve-exif=true" in cmd
+        assert not Path(cmd[-1][1:]).exists()  # argument file cleaned up
+        assert all(f'"{src.as_posix()}"' in listed[0] for src in sources)
+        assert result == {src: src.with_suffix(".jpg") for src in sources}
+
+    def test_quotes_in_filenames_survive(self, mock_logger):
+        double, single, both = (_FAKE_DIR / 'say "hi".heic', _FAKE_DIR / "it's.heic",
+                                _FAKE_DIR / """both '".heic""")
+        calls = []
+
+        def mogrify(cmd, **_kwargs):
+            calls.append((cmd, Path(cmd[-1][1:]).read_text(encoding="utf-8")))
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=mogrify):
+            _mogrify_heic_pending([double, single, both], mock_logger)
+
+        cmd, listed = calls[0]
+        assert listed.splitlines() == [f"'{double.as_posix()}'", f'"{single.as_posix()}"']
+        assert cmd[-2] == both.as_posix()
+
+    def test_partial_failure_retries_the_rest_singly(self, mock_logger, tmp_path):
+        good, bad, later = _mkfiles(tmp_path, [("good.heic", b"heic"), ("bad.heic", b"heic"),
+                                               ("later.heic", b"heic")])
+
+        def magick(cmd, **_kwargs):
+            # mogrify converts "good" and stops at "bad"; single runs fail only for "bad"
+            if cmd[1] == "mogrify":
+                good.with_suffix(".jpg").write_bytes(b"jpg")
+            elif cmd[1] != str(bad):
+                Path(cmd[-1]).write_bytes(b"jpg")
+                return MagicMock(returncode=0)
+            raise subprocess.CalledProcessError(1, "magick")
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=magick) as mock_run:
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_heic_batch([good, bad, later], commit=True, logger=mock_logger)
+
+        assert [c[0][0][1] for c in mock_run.call_args_list] == ["mogrify", str(bad), str(later)]
+        assert mock_trash.call_args_list == [call(str(good)), call(str(later))]
+        assert result == {good: tmp_path / "good.jpg", later: tmp_path / "later.jpg"}
+        assert "bad.jpg" not in _ls(tmp_path)
+        assert mock_logger.error.call_count == 2
+
+    def test_handles_trash_failure(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("a.heic", b"heic")
+
+        def mogrify(*_args, **_kwargs):
+            (tmp_path / "a.jpg").write_bytes(b"jpg")
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=mogrify):
+            with patch("bulk_rename.main.send2trash", side_effect=OSError("trash failed")):
+                result = convert_heic_batch([src], commit=True, logger=mock_logger)
+        assert result == {src: tmp_path / "a.jpg"}
+        mock_logger.error.assert_called()
+
+
+# =============================================================================
+# Tests for in-process HEIC conversion (pillow-heif)
+# =============================================================================
+
+def _write_fake_heic(path, date_time=None, icc_profile=None):
+    """Write an image Pillow can open under a .heic name, standing in for pillow-heif."""
+    exif = Image.Exif()
+    if date_time:
+        exif[306] = date_time
+    Image.new("RGB", (8, 8)).save(path, "PNG", exif=exif, icc_profile=icc_profile)
+
+
+class TestHeicInProcess:
+    """Test HEIC conversion through Pillow when pillow-heif is available."""
+
+    @pytest.fixture(autouse=True)
+    def with_heif(self):
+        with patch("bulk_rename.main.HEIF_AVAILABLE", True):
+            yield
+
+    def test_single_conversion_keeps_exif(self, mock_logger, tmp_path):
+        src = tmp_path / "test.heic"
+        _write_fake_heic(src, "2023:10:15 12:30:45")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
+                mock_run.assert_not_called()
+                mock_trash.assert_called_once_with(str(src))
+
+        assert result == tmp_path / "test.jpg"
+        with Image.open(result) as image:
+            assert image.format == "JPEG"
+            assert image.getexif()[306] == "2023:10:15 12:30:45"
+
+    def test_single_conversion_keeps_icc_profile(self, mock_logger, tmp_path):
+        src = tmp_path / "test.heic"
+        _write_fake_heic(src, icc_profile=b"display p3 profile")
+
+        with patch("bulk_rename.main.send2trash"):
+            result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
+
+        with Image.open(result) as image:
+            assert image.info["icc_profile"] == b"display p3 profile"
+
+    def test_single_conversion_failure_leaves_no_output(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.heic", b"not an image")
+
+        result = convert_heic_to_jpg(src, commit=True, logger=mock_logger)
+        assert result is None
+        assert not (tmp_path / "test.jpg").exists()
+        mock_logger.error.assert_called()
+
+    def test_batch_converts_without_subprocess(self, mock_logger, tmp_path):
+        good = tmp_path / "good.heic"
+        bad = tmp_path / "bad.heic"
+        _write_fake_heic(good)
+        bad.write_bytes(b"not an image")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_heic_batch([good, bad], commit=True, logger=mock_logger)
+                mock_run.assert_not_called()
+                mock_trash.assert_called_once_with(str(good))
+
+        assert result == {good: tmp_path / "good.jpg"}
+        assert not (tmp_path / "bad.jpg").exists()
+        assert mock_logger.error.call_count == 2
 
 
 # =============================================================================
@@ -700,9 +1570,8 @@ class TestConvertMovToMp4:
         result = convert_mov_to_mp4(src, commit=True, logger=mock_logger)
         assert result == dst
 
-    def test_dry_run_logs_command(self, mock_logger, tmp_path):
-        src = tmp_path / "test.mov"
-        src.write_bytes(b"mov")
+    def test_dry_run_logs_command(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.mov", b"mov")
 
         result = convert_mov_to_mp4(src, commit=False, logger=mock_logger)
         assert result == tmp_path / "test.mp4"
@@ -722,9 +1591,8 @@ class TestConvertMovToMp4:
                 assert result == dst
                 mock_run.assert_called_once()
 
-    def test_commit_handles_ffmpeg_failure(self, mock_logger, tmp_path):
-        src = tmp_path / "test.mov"
-        src.write_bytes(b"mov")
+    def test_commit_handles_ffmpeg_failure(self, mock_logger, mkfile):
+        src = mkfile("test.mov", b"mov")
 
         with patch("bulk_rename.main.subprocess.run") as mock_run:
             mock_run.return_value = MagicMock(returncode=1, stderr=b"error")
@@ -743,121 +1611,207 @@ class TestConvertMovToMp4:
         with patch("bulk_rename.main.subprocess.run", side_effect=create_small_dst):
             result = convert_mov_to_mp4(src, commit=True, logger=mock_logger)
             assert result is None
+        assert not dst.exists()  # partial output removed so the next run retries
+
+    def test_stale_empty_output_is_reconverted(self, mock_logger, tmp_path):
+        src, dst = _mkfiles(tmp_path, [("test.mov", b"mov"), ("test.mp4", b"")])
+
+        def create_dst(*_args, **_kwargs):
+            dst.write_bytes(b"x" * 200000)
+            return MagicMock(returncode=0)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=create_dst) as mock_run:
+            with patch("bulk_rename.main.send2trash"):
+                assert convert_mov_to_mp4(src, commit=True, logger=mock_logger) == dst
+        mock_run.assert_called_once()
+        assert dst.stat().st_size == 200000
+
+    def test_ffmpeg_missing_releases_output(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("test.mov", b"mov")
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=FileNotFoundError("ffmpeg")):
+            result = convert_mov_to_mp4(src, commit=True, logger=mock_logger)
+        assert result is None
+        assert not (tmp_path / "test.mp4").exists()
+        mock_logger.error.assert_called()
+
+    def test_existing_output_detected_by_reservation(self, mock_logger, tmp_path):
+        src = tmp_path / "test.mov"
+        dst = tmp_path / "test.mp4"
+        src.write_bytes(b"mov")
+        dst.write_bytes(b"mp4")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            assert convert_mov_to_mp4(src, commit=True, logger=mock_logger) == dst
+            mock_run.assert_not_called()
+        assert dst.read_bytes() == b"mp4"
 
 
 # =============================================================================
-# Tests for convert_files
+# Tests for convert_movs_to_mp4_batch
 # =============================================================================
 
-class TestConvertFiles:
-    """Test convert_files function."""
-
-    def test_converts_heic_files(self, mock_logger, tmp_path):
-        heic_file = tmp_path / "test.heic"
-        heic_file.write_bytes(b"heic")
-
-        metadata = [
-            FileMetadata(
-                original_path=heic_file,
-                timestamp=datetime.now(timezone.utc),
-                extension=".heic",
-                original_name="test.heic",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            )
-        ]
+def _write_mp4_outputs(cmd):
+    """Stand in for ffmpeg: write a large enough file for every output in the argv."""
+    for arg in cmd:
+        if arg.endswith(".mp4"):
+            Path(arg).write_bytes(b"x" * 200000)
+    return MagicMock(returncode=0, stderr=b"")
 
-        with patch("bulk_rename.main.convert_heic_to_jpg") as mock_convert:
-            mock_convert.return_value = tmp_path / "test.jpg"
-            heic_count, mov_count = convert_files(metadata, commit=True, logger=mock_logger)
-            assert heic_count == 1
-            assert mov_count == 0
-            assert metadata[0].was_converted is True
-            assert metadata[0].extension == ".jpg"
-
-    def test_converts_mov_files(self, mock_logger, tmp_path):
-        mov_file = tmp_path / "test.mov"
-        mov_file.write_bytes(b"mov")
-
-        metadata = [
-            FileMetadata(
-                original_path=mov_file,
-                timestamp=datetime.now(timezone.utc),
-                extension=".mov",
-                original_name="test.mov",
-                metadata_reliable=True,
-                timestamp_source="propsys",
-            )
-        ]
 
-        with patch("bulk_rename.main.convert_mov_to_mp4") as mock_convert:
-            result_path = tmp_path / "test.mp4"
-            result_path.write_bytes(b"mp4")
-            mock_convert.return_value = result_path
-            heic_count, mov_count = convert_files(metadata, commit=True, logger=mock_logger)
-            assert heic_count == 0
-            assert mov_count == 1
-            assert metadata[0].was_converted is True
+class TestConvertMovsToMp4Batch:
+    """Test convert_movs_to_mp4_batch function."""
 
-    def test_skips_other_formats(self, mock_logger, tmp_path):
-        jpg_file = tmp_path / "test.jpg"
-        jpg_file.write_bytes(b"jpg")
+    def test_dry_run_maps_all_files(self, mock_logger, tmp_path):
+        sources = [tmp_path / "a.mov", tmp_path / "b.mov"]
+        for src in sources:
+            src.write_bytes(b"mov")
 
-        metadata = [
-            FileMetadata(
-                original_path=jpg_file,
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="test.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            )
-        ]
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            result = convert_movs_to_mp4_batch(sources, commit=False, logger=mock_logger)
+            mock_run.assert_not_called()
+        assert result == {src: src.with_suffix(".mp4") for src in sources}
+        assert _ls(tmp_path) == {"a.mov", "b.mov"}
 
-        heic_count, mov_count = convert_files(metadata, commit=True, logger=mock_logger)
-        assert heic_count == 0
-        assert mov_count == 0
-        assert metadata[0].was_converted is False
-
-    def test_no_convert_flag_skips_conversions(self, mock_logger, tmp_path):
-        heic_file = tmp_path / "test.heic"
-        mov_file = tmp_path / "test.mov"
-        heic_file.write_bytes(b"heic")
-        mov_file.write_bytes(b"mov")
-
-        metadata = [
-            FileMetadata(
-                original_path=heic_file,
-                timestamp=datetime.now(timezone.utc),
-                extension=".heic",
-                original_name="test.heic",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
-            FileMetadata(
-                original_path=mov_file,
-                timestamp=datetime.now(timezone.utc),
-                extension=".mov",
-                original_name="test.mov",
-                metadata_reliable=True,
-                timestamp_source="propsys",
-            )
-        ]
+    def test_skips_existing_dst(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("a.mov", b"mov")
+        (tmp_path / "a.mp4").write_bytes(b"mp4")
 
-        with patch("bulk_rename.main.convert_heic_to_jpg") as mock_heic:
-            with patch("bulk_rename.main.convert_mov_to_mp4") as mock_mov:
-                heic_count, mov_count = convert_files(
-                    metadata, commit=True, logger=mock_logger, no_convert=True
-                )
-                assert heic_count == 0
-                assert mov_count == 0
-                assert metadata[0].was_converted is False
-                assert metadata[1].was_converted is False
-                mock_heic.assert_not_called()
-                mock_mov.assert_not_called()
-                mock_logger.info.assert_called_with(
-                    "Skipping Apple file conversion (--no-convert flag set)"
-                )
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            result = convert_movs_to_mp4_batch([src], commit=True, logger=mock_logger)
+            mock_run.assert_not_called()
+        assert result == {src: tmp_path / "a.mp4"}
+
+    def test_commit_runs_one_ffmpeg_per_group(self, mock_logger, tmp_path):
+        sources = [tmp_path / f"IMG_{i}.mov" for i in range(5)]
+        for src in sources:
+            src.write_bytes(b"mov")
+
+        with patch("bulk_rename.main.subprocess.run",
+                   side_effect=lambda cmd, **_kw: _write_mp4_outputs(cmd)) as mock_run:
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_movs_to_mp4_batch(sources, commit=True, logger=mock_logger)
+                assert mock_trash.call_count == 5
+
+        # Groups of four run concurrently, so the calls may arrive in either order
+        cmds = sorted((c[0][0] for c in mock_run.call_args_list), key=len, reverse=True)
+        assert [cmd.count("-i") for cmd in cmds] == [4, 1]
+        first = cmds[0]
+        assert first[first.index("-map") + 1] == "0:v:0"
+        assert "3:a:0?" in first
+        assert "libx264" in first
+        assert result == {src: src.with_suffix(".mp4") for src in sources}
+
+    def test_groups_run_concurrently(self, mock_logger, tmp_path):
+        sources = _mkfiles(tmp_path, [(f"IMG_{i}.mov", b"mov") for i in range(5)])
+        barrier = threading.Barrier(2, timeout=5)
+
+        def ffmpeg(cmd, **_kwargs):
+            barrier.wait()  # only returns once both groups are in flight
+            return _write_mp4_outputs(cmd)
+
+        with patch("bulk_rename.main.subprocess.run", side_effect=ffmpeg), \
+                patch("bulk_rename.main.send2trash"):
+            result = convert_movs_to_mp4_batch(sources, commit=True, logger=mock_logger)
+
+        assert result == {src: src.with_suffix(".mp4") for src in sources}
+
+    def test_handles_trash_failure(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("a.mov", b"mov")
+
+        with patch("bulk_rename.main.subprocess.run",
+                   side_effect=lambda cmd, **_kw: _write_mp4_outputs(cmd)):
+            with patch("bulk_rename.main.send2trash", side_effect=OSError("trash failed")):
+                result = convert_movs_to_mp4_batch([src], commit=True, logger=mock_logger)
+        assert result == {src: tmp_path / "a.mp4"}
+        mock_logger.error.assert_called()
+
+    def test_small_output_is_discarded(self, mock_logger, tmp_path, mkfile):
+        src = mkfile("a.mov", b"mov")
+
+        with patch("bulk_rename.main.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=0, stderr=b"")
+            with patch("bulk_rename.main.send2trash") as mock_trash:
+                result = convert_movs_to_mp4_batch([src], commit=True, logger=mock_logger)
+                mock_trash.assert_not_called()
+        assert not result
+        assert not (tmp_path / "a.mp4").exists()
+        mock_logger.error.assert_called()
+
+    @pytest.mark.parametrize("failure", [
+        {"return_value": MagicMock(returncode=1, stderr=b"bad input")},
+        {"side_effect": FileNotFoundError("ffmpeg")},
+    ], ids=["ffmpeg-error", "ffmpeg-missing"])
+    def test_failed_group_falls_back_to_single_files(self, mock_logger, tmp_path, failure):
+        good = tmp_path / "good.mov"
+        bad = tmp_path / "bad.mov"
+        good.write_bytes(b"mov")
+        bad.write_bytes(b"mov")
+        placeholders = []
+
+        def single(src_path, _commit, _logger):
+            placeholders.append(src_path.with_suffix(".mp4").exists())
+            return src_path.with_suffix(".mp4") if src_path == good else None
+
+        with patch("bulk_rename.main.subprocess.run", **failure):
+            with patch("bulk_rename.main.convert_mov_to_mp4", side_effect=single):
+                result = convert_movs_to_mp4_batch([good, bad], commit=True, logger=mock_logger)
+
+        assert placeholders == [False, False]  # batch outputs cleared before retrying
+        assert result == {good: tmp_path / "good.mp4"}
+        mock_logger.error.assert_called()
+
+
+# =============================================================================
+# Tests for convert_files
+# =============================================================================
+
+class TestConvertFiles:
+    """Test convert_files function.
+
+    The converters are mocked, so the entries point at paths that never touch the disk.
+    """
+
+    @pytest.fixture
+    def converters(self, mocker):
+        """Patch both batch converters to convert every file they are given."""
+        def converted(paths, suffix):
+            return {path: path.with_suffix(suffix) for path in paths}
+        heic = mocker.patch("bulk_rename.main.convert_heic_batch",
+                            side_effect=lambda paths, **_: converted(paths, ".jpg"))
+        mov = mocker.patch("bulk_rename.main.convert_movs_to_mp4_batch",
+                           side_effect=lambda paths, **_: converted(paths, ".mp4"))
+        return heic, mov
+
+    @pytest.mark.parametrize("ext, no_convert, expected", [
+        (".heic", False, (1, 0, ".jpg")),
+        (".mov", False, (0, 1, ".mp4")),
+        (".jpg", False, (0, 0, ".jpg")),
+        (".heic", True, (0, 0, ".heic")),
+        (".mov", True, (0, 0, ".mov")),
+    ], ids=["heic", "mov", "other-format", "heic-no-convert", "mov-no-convert"])
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def test_convert_files(self, mock_logger, converters, ext, no_convert, expected):
+        """``expected`` is (heic_count, mov_count, extension after conversion)."""
+        heic_count, mov_count, final_ext = expected
+        source = _FAKE_DIR / f"test{ext}"
+        metadata = [_fm(source)]
+
+        counts = convert_files(metadata, commit=True, logger=mock_logger, no_convert=no_convert)
+
+        assert counts == (heic_count, mov_count)
+        assert metadata[0].extension == final_ext
+        assert metadata[0].original_path == source.with_suffix(final_ext)
+        assert metadata[0].was_converted is (final_ext != ext)
+        for converter, count in zip(converters, (heic_count, mov_count)):
+            if count:
+                converter.assert_called_once_with([source], commit=True, logger=mock_logger)
+            else:
+                converter.assert_not_called()
+        if no_convert:
+            mock_logger.info.assert_called_with(
+                "Skipping Apple file conversion (--no-convert flag set)"
+            )
 
 
 # =============================================================================
@@ -883,92 +1837,47 @@ class TestParseFilenameDate:
         result = parse_filename_date("99991399-0.jpg")
         assert result is None
 
+    def test_returns_none_for_invalid_day(self):
+        assert parse_filename_date("20230230-0.jpg") is None
+
+    def test_uses_precomputed_match(self):
+        match = DEST_PATTERN.search("20231015-0.jpg")
+        with patch("bulk_rename.main.DEST_PATTERN") as mock_pattern:
+            result = parse_filename_date("20231015-0.jpg", match)
+        mock_pattern.search.assert_not_called()
+        assert result == datetime(2023, 10, 15, tzinfo=timezone.utc)
+
 
 # =============================================================================
 # Tests for should_skip_file
 # =============================================================================
 
+_DEFAULT_TS = datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+
 class TestShouldSkipFile:
     """Test should_skip_file function."""
 
-    def test_skip_no_matching_pattern(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/random_file.jpg"),
-            timestamp=datetime.now(timezone.utc),
-            extension=".jpg",
-            original_name="random_file.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF",
-        )
-        should_skip, extra_text, reason = should_skip_file(entry, mock_logger)
-        assert should_skip is True
-        assert extra_text == ""
-        assert reason == "pattern"
-
-    def test_no_skip_img_pattern(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/IMG_1234.jpg"),
-            timestamp=datetime.now(timezone.utc),
-            extension=".jpg",
-            original_name="IMG_1234.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF",
-        )
-        should_skip, _extra_text, reason = should_skip_file(entry, mock_logger)
-        assert should_skip is False
-        assert reason is None
-
-    def test_skip_already_renamed_unreliable_metadata(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/20231015-0.jpg"),
-            timestamp=datetime.now(timezone.utc),
-            extension=".jpg",
-            original_name="20231015-0.jpg",
-            metadata_reliable=False,
-            timestamp_source="fallback",
-        )
-        should_skip, _extra_text, reason = should_skip_file(entry, mock_logger)
-        assert should_skip is True
-        assert reason == "already_renamed"
-
-    def test_skip_already_renamed_matching_date(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/20231015-0.jpg"),
-            timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-            extension=".jpg",
-            original_name="20231015-0.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF",
-        )
-        should_skip, _extra_text, reason = should_skip_file(entry, mock_logger)
-        assert should_skip is True
-        assert reason == "already_renamed"
-
-    def test_no_skip_date_mismatch(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/20231020-0.jpg"),
-            timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-            extension=".jpg",
-            original_name="20231020-0.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF",
-        )
-        should_skip, _extra_text, reason = should_skip_file(entry, mock_logger)
-        assert should_skip is False
-        assert reason is None
-
-    def test_extracts_extra_text_from_pattern(self, mock_logger):
-        entry = FileMetadata(
-            original_path=Path("/test/IMG_1234_extra.jpg"),
-            timestamp=datetime.now(timezone.utc),
-            extension=".jpg",
-            original_name="IMG_1234_extra.jpg",
-            metadata_reliable=True,
-            timestamp_source="EXIF",
-        )
-        should_skip, extra_text, _reason = should_skip_file(entry, mock_logger)
-        assert should_skip is False
-        assert "_extra.jpg" in extra_text
+    @pytest.mark.parametrize(
+        "filename, reliable, expected",
+        [
+            ("random_file.jpg", True, (True, "", "pattern")),
+            ("IMG_1234.jpg", True, (False, ".jpg", None)),
+            ("20231015-0.jpg", False, (True, "", "already_renamed")),
+            ("20231015-0.jpg", True, (True, "", "already_renamed")),
+            ("20231020-0.jpg", True, (False, ".jpg", None)),
+            ("IMG_1234_extra.jpg", True, (False, "_extra.jpg", None)),
+        ],
+        ids=[
+            "random_file.jpg", "IMG_1234.jpg", "20231015-0-unreliable",
+            "20231015-0-reliable", "20231020-0-date-mismatch", "IMG_1234_extra.jpg",
+        ],
+    )
+    def test_should_skip(self, filename, reliable, expected, mock_logger):
+        """``expected`` is the (should_skip, extra_text, skip_reason) tuple."""
+        entry = _fm(Path("/test") / filename, ts=_DEFAULT_TS, reliable=reliable,
+                    src="EXIF" if reliable else "fallback")
+        assert should_skip_file(entry, mock_logger) == expected
 
 
 # =============================================================================
@@ -978,162 +1887,176 @@ class TestShouldSkipFile:
 class TestRenameFiles:
     """Test rename_files function."""
 
-    def test_renames_files_in_order(self, mock_logger, tmp_path):
-        file1 = tmp_path / "IMG_0001.jpg"
-        file2 = tmp_path / "IMG_0002.jpg"
-        file1.write_bytes(b"test1")
-        file2.write_bytes(b"test2")
-
-        metadata = [
-            FileMetadata(
-                original_path=file1,
-                timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name="IMG_0001.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
-            FileMetadata(
-                original_path=file2,
-                timestamp=datetime(2023, 10, 15, 14, 0, 0, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name="IMG_0002.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
-        ]
+    def test_sequence_restarts_each_day(self, mock_logger, tmp_path):
+        days = [datetime(2023, 10, 15, 9, tzinfo=timezone.utc),
+                datetime(2023, 10, 15, 18, tzinfo=timezone.utc),
+                datetime(2023, 10, 16, 9, tzinfo=timezone.utc)]
+        metadata = []
+        for i, timestamp in enumerate(days):
+            name = f"IMG_000{i}.jpg"
+            (tmp_path / name).write_bytes(b"test")
+            metadata.append(_fm(tmp_path / name, ts=timestamp))
+
+        count = rename_files(metadata, tmp_path, commit=True, logger=mock_logger,
+                             existing_names={m.original_name for m in metadata})
+        assert count == 3
+        assert sorted(_ls(tmp_path)) == [
+            "20231015-0.jpg", "20231015-1.jpg", "20231016-0.jpg"]
+
+    @pytest.mark.parametrize("present, entries, commit, expected", [
+        (("IMG_0001.jpg", "IMG_0002.jpg"), (("IMG_0001.jpg", 12), ("IMG_0002.jpg", 14)), True,
+         (2, ["20231015-0.jpg", "20231015-1.jpg"], [None, None])),
+        (("IMG_0001.jpg", "20231015-0.jpg"), (("IMG_0001.jpg", 12),), True,
+         (1, ["20231015-0.jpg", "20231015-1.jpg"], [None])),
+        (("random.jpg",), (("random.jpg", 12),), True,
+         (0, ["random.jpg"], ["pattern"])),
+        (("IMG_0001.jpg",), (("IMG_0001.jpg", 12),), False,
+         (1, ["IMG_0001.jpg"], [None])),
+    ], ids=["renames-in-order", "collision", "skip-reason", "dry-run"])
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def test_rename_files(self, mock_logger, tmp_path, present, entries, commit, expected):
+        """``present`` names the files in the folder, ``entries`` the (name, hour) metadata.
+
+        ``expected`` is (rename count, folder listing afterwards, skip reason per entry).
+        """
+        count, listing, skip_reasons = expected
+        _mkfiles(tmp_path, [(name, b"test") for name in present])
+        metadata = [_entry(tmp_path / name, ".jpg", hour) for name, hour in entries]
+
+        assert rename_files(metadata, tmp_path, commit=commit, logger=mock_logger,
+                            existing_names=set(present)) == count
+        assert sorted(_ls(tmp_path)) == listing
+        assert [entry.skip_reason for entry in metadata] == skip_reasons
+
+    def test_registers_converted_names(self, mock_logger, tmp_path):
+        converted = _entry(tmp_path / "IMG_0001.jpg", ".jpg", 9)
+        converted.was_converted = True
+        names = set()
+
+        with patch("bulk_rename.main.rename_file", return_value=False):
+            rename_files([converted], tmp_path, commit=False, logger=mock_logger,
+                         existing_names=names)
+
+        assert names == {"IMG_0001.jpg"}
+
+    @pytest.mark.parametrize("debug_enabled", [True, False], ids=["debug", "no-debug"])
+    def test_debug_logging_checked_once_per_run(self, mock_logger, tmp_path, debug_enabled):
+        cached = _entry(tmp_path / "notes.jpg", ".jpg", 9)
+        cached.skip_reason = "pattern"
+        converted = _entry(tmp_path / "IMG_0002.jpg", ".jpg", 10)
+        converted.was_converted = True
+        mock_logger.isEnabledFor.return_value = debug_enabled
+
+        rename_files([cached, converted], tmp_path, commit=False, logger=mock_logger,
+                     existing_names=set())
+
+        mock_logger.isEnabledFor.assert_called_once_with(logging.DEBUG)
+        assert mock_logger.debug.called is debug_enabled
 
-        count = rename_files(metadata, tmp_path, commit=True, logger=mock_logger)
-        assert count == 2
-        assert (tmp_path / "20231015-0.jpg").exists()
-        assert (tmp_path / "20231015-1.jpg").exists()
-
-    def test_handles_collision(self, mock_logger, tmp_path):
-        file1 = tmp_path / "IMG_0001.jpg"
-        existing = tmp_path / "20231015-0.jpg"
-        file1.write_bytes(b"test1")
-        existing.write_bytes(b"existing")
-
-        metadata = [
-            FileMetadata(
-                original_path=file1,
-                timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name="IMG_0001.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
-        ]
 
-        count = rename_files(metadata, tmp_path, commit=True, logger=mock_logger)
-        assert count == 1
-        assert (tmp_path / "20231015-1.jpg").exists()
-
-    def test_sets_skip_reason(self, mock_logger, tmp_path):
-        file1 = tmp_path / "random.jpg"
-        file1.write_bytes(b"test")
-
-        metadata = [
-            FileMetadata(
-                original_path=file1,
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="random.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
-        ]
+# =============================================================================
+# Tests for convert_and_rename
+# =============================================================================
 
-        rename_files(metadata, tmp_path, commit=True, logger=mock_logger)
-        assert metadata[0].skip_reason == "pattern"
-
-    def test_dry_run(self, mock_logger, tmp_path):
-        file1 = tmp_path / "IMG_0001.jpg"
-        file1.write_bytes(b"test")
-
-        metadata = [
-            FileMetadata(
-                original_path=file1,
-                timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name="IMG_0001.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            ),
+def _entry(path, extension, hour):
+    """Build a reliable FileMetadata entry on 2023-10-15 at the given hour."""
+    return _fm(path, ts=datetime(2023, 10, 15, hour, tzinfo=timezone.utc), ext=extension)
+
+
+class TestConvertAndRename:
+    """Test convert_and_rename function."""
+
+    def test_converts_then_renames_in_one_pass(self, mock_logger, tmp_path):
+        heic = _entry(tmp_path / "IMG_0001.heic", ".heic", 9)
+        mov = _entry(tmp_path / "IMG_0002.mov", ".mov", 10)
+        jpg = _entry(tmp_path / "IMG_0003.jpg", ".jpg", 11)
+        names = {"IMG_0001.heic", "IMG_0002.mov", "IMG_0003.jpg"}
+        stats = ProcessingStats(commit=False)
+        calls = Mock()
+
+        with patch("bulk_rename.main.convert_heic_batch",
+                   return_value={heic.original_path: tmp_path / "IMG_0001.jpg"}), \
+                patch("bulk_rename.main.convert_movs_to_mp4_batch",
+                      side_effect=lambda paths, **_kw: (
+                          calls.convert([p.name for p in paths]),
+                          {p: p.with_suffix(".mp4") for p in paths})[1]), \
+                patch("bulk_rename.main.rename_file",
+                      side_effect=lambda src, dst, **_kw: calls.rename(src.name, dst.name)):
+            convert_and_rename([heic, mov, jpg], tmp_path, names, stats, mock_logger)
+
+        assert (stats.heic_count, stats.mov_count, stats.rename_count) == (1, 1, 3)
+        renames = [c for c in calls.mock_calls if c[0] == "rename"]
+        assert renames == [
+            call.rename("IMG_0001.jpg", "20231015-0.jpg"),
+            call.rename("IMG_0002.mp4", "20231015-1.mp4"),
+            call.rename("IMG_0003.jpg", "20231015-2.jpg"),
         ]
+        # Every conversion finishes before the first rename
+        assert calls.mock_calls[0] == call.convert(["IMG_0002.mov"])
+        # Conversion outputs were registered, then released by their own renames
+        assert names == {"IMG_0001.heic", "IMG_0002.mov",
+                         "20231015-0.jpg", "20231015-1.mp4", "20231015-2.jpg"}
 
-        count = rename_files(metadata, tmp_path, commit=False, logger=mock_logger)
-        assert count == 1
-        assert file1.exists()  # Not actually renamed
+    def test_failed_mov_conversion_keeps_original(self, mock_logger, tmp_path):
+        mov = _entry(tmp_path / "IMG_0002.mov", ".mov", 10)
+        stats = ProcessingStats(commit=False)
+
+        with patch("bulk_rename.main.convert_movs_to_mp4_batch", return_value={}), \
+                patch("bulk_rename.main.rename_file", return_value=True) as mock_rename:
+            convert_and_rename([mov], tmp_path, set(), stats, mock_logger)
+
+        assert stats.mov_count == 0
+        assert mov.extension == ".mov"
+        assert mock_rename.call_args[0][0] == tmp_path / "IMG_0002.mov"
+
+    def test_no_convert_only_renames(self, mock_logger, tmp_path):
+        heic = _entry(tmp_path / "IMG_0001.heic", ".heic", 9)
+        mov = _entry(tmp_path / "IMG_0002.mov", ".mov", 10)
+        stats = ProcessingStats(commit=False, no_convert=True)
+
+        with patch("bulk_rename.main.convert_heic_batch") as mock_heic, \
+                patch("bulk_rename.main.convert_movs_to_mp4_batch") as mock_mov:
+            convert_and_rename([heic, mov], tmp_path, set(), stats, mock_logger)
+
+        mock_heic.assert_not_called()
+        mock_mov.assert_not_called()
+        assert (stats.heic_count, stats.mov_count, stats.rename_count) == (0, 0, 2)
 
 
 # =============================================================================
 # Tests for log_summary
 # =============================================================================
 
+# log_summary only reads its inputs, so every test shares these
+_SUMMARY_META = (
+    _fm(Path("/test/file.jpg"), was_converted=True),
+    _fm(Path("/test/file2.jpg"), skip_reason="pattern"),
+    _fm(Path("/test/file3.jpg"), skip_reason="already_renamed"),
+)
+_SUMMARY_STATS = ProcessingStats(
+    heic_count=2,
+    mov_count=1,
+    rename_count=5,
+    commit=True,
+    elapsed=timedelta(seconds=10),
+)
+
+
 class TestLogSummary:
     """Test log_summary function."""
 
     def test_logs_all_stats(self, mock_logger):
-        metadata = [
-            FileMetadata(
-                original_path=Path("/test/file.jpg"),
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="file.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-                was_converted=True,
-                skip_reason=None,
-            ),
-            FileMetadata(
-                original_path=Path("/test/file2.jpg"),
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="file2.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-                skip_reason="pattern",
-            ),
-            FileMetadata(
-                original_path=Path("/test/file3.jpg"),
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="file3.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-                skip_reason="already_renamed",
-            ),
-        ]
-        stats = ProcessingStats(
-            heic_count=2,
-            mov_count=1,
-            rename_count=5,
-            commit=True,
-            elapsed=timedelta(seconds=10),
-        )
-
-        log_summary(metadata, stats, mock_logger)
+        log_summary(_SUMMARY_META, _SUMMARY_STATS, mock_logger)
         assert mock_logger.info.call_count >= 5
 
     def test_dry_run_message(self, mock_logger):
         stats = ProcessingStats(rename_count=5, commit=False)
         log_summary([], stats, mock_logger)
         # Check that "Would rename" message was logged
-        calls = [str(c) for c in mock_logger.info.call_args_list]
-        assert any("Would rename" in c for c in calls)
+        calls = "\n".join(map(str, mock_logger.info.call_args_list))
+        assert "Would rename" in calls
 
     def test_no_convert_flag_skips_conversion_logs(self, mock_logger):
-        metadata = [
-            FileMetadata(
-                original_path=Path("/test/file.jpg"),
-                timestamp=datetime.now(timezone.utc),
-                extension=".jpg",
-                original_name="file.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            )
-        ]
         stats = ProcessingStats(
             heic_count=0,
             mov_count=0,
@@ -1143,18 +2066,18 @@ class TestLogSummary:
             elapsed=timedelta(seconds=5),
         )
 
-        log_summary(metadata, stats, mock_logger)
+        log_summary(_SUMMARY_META, stats, mock_logger)
 
         # Verify conversion stats are NOT logged
-        calls = [str(c) for c in mock_logger.info.call_args_list]
-        assert not any("Converted" in c for c in calls)
-        assert not any(".heic files to .jpg" in c for c in calls)
-        assert not any(".mov files to .mp4" in c for c in calls)
-        assert not any("were converted files" in c for c in calls)
+        calls = "\n".join(map(str, mock_logger.info.call_args_list))
+        assert "Converted" not in calls
+        assert ".heic files to .jpg" not in calls
+        assert ".mov files to .mp4" not in calls
+        assert "were converted files" not in calls
 
         # Verify standard stats are still logged
-        assert any("Evaluated" in c for c in calls)
-        assert any("Renamed" in c for c in calls)
+        assert "Evaluated" in calls
+        assert "Renamed" in calls
 
 
 # =============================================================================
@@ -1164,27 +2087,14 @@ class TestLogSummary:
 class TestProcessFolder:
     """Test process_folder function."""
 
-    def test_processes_folder(self, mock_logger, tmp_path):
-        jpg_file = tmp_path / "IMG_1234.jpg"
-        jpg_file.write_bytes(b"test")
+    def test_processes_folder(self, mock_logger, tmp_path, mkfile, mocker):
+        jpg_file = mkfile("IMG_1234.jpg", b"test")
+        mocker.patch("bulk_rename.main.collect_file_metadata",
+                     return_value=[_fm(jpg_file, ts=datetime(2023, 10, 15, tzinfo=timezone.utc))])
+        mock_convert_rename = mocker.patch("bulk_rename.main.convert_and_rename")
 
-        with patch("bulk_rename.main.collect_file_metadata") as mock_collect:
-            mock_collect.return_value = [
-                FileMetadata(
-                    original_path=jpg_file,
-                    timestamp=datetime(2023, 10, 15, tzinfo=timezone.utc),
-                    extension=".jpg",
-                    original_name="IMG_1234.jpg",
-                    metadata_reliable=True,
-                    timestamp_source="EXIF",
-                )
-            ]
-            with patch("bulk_rename.main.convert_files") as mock_convert:
-                mock_convert.return_value = (0, 0)
-                with patch("bulk_rename.main.rename_files") as mock_rename:
-                    mock_rename.return_value = 1
-                    result = process_folder(str(tmp_path), commit=False, logger=mock_logger)
-                    assert result == 0
+        assert process_folder(str(tmp_path), commit=False, logger=mock_logger) == 0
+        mock_convert_rename.assert_called_once()
 
     def test_filters_by_suffix(self, mock_logger, tmp_path):
         jpg_file = tmp_path / "test.jpg"
@@ -1200,6 +2110,162 @@ class TestProcessFolder:
             assert len(call_args) == 1
             assert call_args[0].suffix == ".jpg"
 
+    def test_passes_scanned_mtimes(self, mock_logger, tmp_path, mkfile):
+        jpg_file = mkfile("test.jpg", b"jpg")
+        (tmp_path / "subdir.jpg").mkdir()
+
+        with patch("bulk_rename.main.collect_file_metadata") as mock_collect, \
+                patch("bulk_rename.main._SCANDIR_CACHES_STAT", True):
+            mock_collect.return_value = []
+            process_folder(str(tmp_path), commit=False, logger=mock_logger)
+            mtimes = mock_collect.call_args[1]["mtimes"]
+            assert mtimes == {jpg_file: jpg_file.stat().st_mtime}
+
+    def test_passes_scanned_names_to_rename(self, mock_logger, tmp_path):
+        (tmp_path / "IMG_0001.heic").write_bytes(b"heic")
+        (tmp_path / "notes.txt").write_bytes(b"txt")
+
+        with patch("bulk_rename.main.collect_file_metadata", return_value=[]), \
+                patch("bulk_rename.main.convert_and_rename") as mock_convert_rename, \
+                patch.object(Path, "iterdir") as mock_iterdir:
+            process_folder(str(tmp_path), commit=True, logger=mock_logger)
+
+        mock_iterdir.assert_not_called()
+        assert mock_convert_rename.call_args[0][2] == {"IMG_0001.heic", "notes.txt"}
+
+
+# =============================================================================
+# Tests for _scan_folder
+# =============================================================================
+
+class TestScanFolder:
+    """Test _scan_folder function."""
+
+    def test_lists_supported_files_and_all_names(self, tmp_path):
+        (tmp_path / "IMG_0001.jpg").write_bytes(b"jpg")
+        (tmp_path / "notes.txt").write_bytes(b"txt")
+        (tmp_path / "sub.mp4").mkdir()
+
+        file_list, _mtimes, names = _scan_folder(tmp_path)
+
+        assert file_list == [tmp_path / "IMG_0001.jpg"]
+        assert names == {"IMG_0001.jpg", "notes.txt"}
+
+    def test_skips_stat_when_scandir_lacks_stat(self, tmp_path):
+        (tmp_path / "IMG_0001.jpg").write_bytes(b"jpg")
+
+        with patch("bulk_rename.main._SCANDIR_CACHES_STAT", False), \
+                patch("bulk_rename.main._fast_stat_mtime") as mock_fast:
+            _file_list, mtimes, _names = _scan_folder(tmp_path)
+
+        mock_fast.assert_not_called()
+        assert not mtimes
+
+    def test_uses_cached_entry_stat_on_windows(self, tmp_path):
+        (tmp_path / "IMG_0001.jpg").write_bytes(b"jpg")
+
+        with patch("bulk_rename.main._SCANDIR_CACHES_STAT", True), \
+                patch("bulk_rename.main._fast_stat_mtime") as mock_fast:
+            _file_list, mtimes, _names = _scan_folder(tmp_path)
+
+        mock_fast.assert_not_called()
+        assert mtimes == {tmp_path / "IMG_0001.jpg": os.stat(tmp_path / "IMG_0001.jpg").st_mtime}
+
+
+class TestScanMtime:
+    """Test _scan_mtime function."""
+
+    def test_stats_once_on_first_use(self, tmp_path):
+        path = tmp_path / "IMG_0001.jpg"
+        mtimes = {}
+
+        with patch("bulk_rename.main._fast_stat_mtime", return_value=42.0) as mock_fast:
+            assert _scan_mtime(path, mtimes) == 42.0
+            assert _scan_mtime(path, mtimes) == 42.0
+
+        mock_fast.assert_called_once_with(path)
+        assert mtimes == {path: 42.0}
+
+    def test_missing_file_is_none(self, tmp_path):
+        assert _scan_mtime(tmp_path / "missing.jpg", {}) is None
+
+
+# =============================================================================
+# Tests for the skip cache
+# =============================================================================
+
+class TestSkipCache:
+    """Test load_skip_cache, save_skip_cache, and their use in process_folder."""
+
+    def test_missing_cache_is_empty(self, mock_logger, tmp_path):
+        assert not load_skip_cache(tmp_path / "missing.json", mock_logger)
+        mock_logger.warning.assert_not_called()
+
+    def test_invalid_cache_is_ignored(self, mock_logger, tmp_path):
+        cache_file = tmp_path / "skip.json"
+        cache_file.write_text('{"a.jpg": 5}', encoding="utf-8")
+        assert not load_skip_cache(cache_file, mock_logger)
+        mock_logger.warning.assert_called_once()
+
+    def test_round_trip(self, mock_logger, tmp_path):
+        cache_file = tmp_path / "skip.json"
+        skip_cache = {"/photos/random.jpg": (1234567890.123456, "pattern", 1697373045.0)}
+        save_skip_cache(cache_file, skip_cache, mock_logger)
+        assert load_skip_cache(cache_file, mock_logger) == skip_cache
+
+    def test_save_failure_warns(self, mock_logger, tmp_path):
+        save_skip_cache(tmp_path, {}, mock_logger)
+        mock_logger.warning.assert_called_once()
+
+    def test_unchanged_files_skip_metadata_and_matching(self, mock_logger, tmp_path, mkfile):
+        skipped = mkfile("random.jpg", b"test")
+        cache_file = tmp_path / "skip.json"
+
+        process_folder(str(tmp_path), commit=True, logger=mock_logger, cache_path=cache_file)
+        cached = load_skip_cache(cache_file, mock_logger)
+        mtime = skipped.stat().st_mtime
+        assert cached == {str(skipped): (mtime, "pattern", pytest.approx(mtime, abs=1e-6))}
+
+        mock_logger.reset_mock()
+        with patch("bulk_rename.main.collect_file_metadata", return_value=[]) as mock_collect, \
+                patch("bulk_rename.main.should_skip_file") as mock_skip:
+            process_folder(str(tmp_path), commit=True, logger=mock_logger, cache_path=cache_file)
+        assert mock_collect.call_args[1]["file_list"] == []
+        mock_skip.assert_not_called()
+        # The cached entry still counts towards the summary
+        mock_logger.info.assert_any_call("Skipped %d files", 1)
+
+    def test_cached_entries_keep_their_sequence_slot(self, mock_logger, tmp_path):
+        skipped, renamed = _mkfiles(tmp_path, [("random.jpg", b"test"), ("IMG_0001.jpg", b"test")])
+        cache_file = tmp_path / "skip.json"
+        save_skip_cache(cache_file, {str(skipped): (skipped.stat().st_mtime, "pattern",
+                                                    _entry(skipped, ".jpg", 9).timestamp
+                                                    .timestamp())}, mock_logger)
+
+        with patch("bulk_rename.main.collect_file_metadata",
+                   return_value=[_entry(renamed, ".jpg", 10)]):
+            process_folder(str(tmp_path), commit=True, logger=mock_logger, cache_path=cache_file)
+
+        assert _ls(tmp_path) == {"random.jpg", "20231015-1.jpg", "skip.json"}
+
+    def test_modified_files_are_rechecked(self, mock_logger, tmp_path, mkfile):
+        skipped = mkfile("random.jpg", b"test")
+        cache_file = tmp_path / "skip.json"
+        save_skip_cache(cache_file, {str(skipped): (1.0, "pattern", 1.0)}, mock_logger)
+
+        with patch("bulk_rename.main.should_skip_file",
+                   return_value=(True, "", "pattern")) as mock_skip:
+            process_folder(str(tmp_path), commit=True, logger=mock_logger, cache_path=cache_file)
+        mock_skip.assert_called_once()
+
+    def test_renamed_files_are_dropped(self, mock_logger, tmp_path, mkfile):
+        renamed = mkfile("IMG_0001.jpg", b"test")
+        cache_file = tmp_path / "skip.json"
+        save_skip_cache(cache_file, {str(renamed): (1.0, "pattern", 1.0)}, mock_logger)
+
+        process_folder(str(tmp_path), commit=True, logger=mock_logger, cache_path=cache_file)
+        assert not load_skip_cache(cache_file, mock_logger)
+
 
 # =============================================================================
 # Tests for main
@@ -1214,152 +2280,134 @@ class TestMain:
                 main()
             assert exc_info.value.code == 1
 
-    def test_valid_folder_runs(self, tmp_path):
-        with patch("sys.argv", ["bulk-rename", "--folder", str(tmp_path)]):
-            with patch("bulk_rename.main.process_folder") as mock_process:
-                mock_process.return_value = 0
-                with pytest.raises(SystemExit) as exc_info:
-                    main()
-                assert exc_info.value.code == 0
-
-    def test_verbose_flag(self, tmp_path):
-        with patch("sys.argv", ["bulk-rename", "--folder", str(tmp_path), "-v"]):
-            with patch("bulk_rename.main.process_folder") as mock_process:
-                mock_process.return_value = 0
-                with patch("bulk_rename.main.setup_logger") as mock_logger:
-                    mock_logger.return_value = MagicMock()
-                    with pytest.raises(SystemExit):
-                        main()
-                    mock_logger.assert_called_with(
-                        "bulk-rename", verbose=True
-                    )
-
-    def test_commit_flag(self, tmp_path):
-        with patch("sys.argv", ["bulk-rename", "--folder", str(tmp_path), "-c"]):
-            with patch("bulk_rename.main.process_folder") as mock_process:
-                mock_process.return_value = 0
-                with pytest.raises(SystemExit):
-                    main()
-                mock_process.assert_called_once()
-                assert mock_process.call_args[0][1] is True  # commit=True
-
-    def test_no_convert_flag(self, tmp_path):
-        with patch("sys.argv", ["bulk-rename", "--folder", str(tmp_path), "--no-convert"]):
-            with patch("bulk_rename.main.process_folder") as mock_process:
-                mock_process.return_value = 0
-                with pytest.raises(SystemExit):
-                    main()
-                mock_process.assert_called_once()
-                assert mock_process.call_args[0][3] is True  # no_convert=True
+    @pytest.fixture
+    def patched_main(self, mocker):
+        """Patch out the folder processing and logger setup that main() drives."""
+        process = mocker.patch("bulk_rename.main.process_folder", return_value=0)
+        setup = mocker.patch("bulk_rename.main.setup_logger",
+                             return_value=MagicMock(spec=logging.Logger))
+        return process, setup
+
+    @pytest.mark.parametrize("extra_args, expected", [
+        ([], {}),
+        (["-v"], {"verbose": True}),
+        (["--bulk"], {"bulk": True}),
+        (["-c"], {"commit": True}),
+        (["--no-convert"], {"no_convert": True}),
+        (["--cache", "skip.json"], {"cache": Path("skip.json")}),
+    ], ids=["defaults", "verbose", "bulk", "commit", "no-convert", "cache"])
+    def test_cli_flags(self, tmp_path, patched_main, extra_args, expected):
+        process, setup = patched_main
+        options = {"verbose": False, "bulk": False, "commit": False,
+                   "no_convert": False, "cache": None, **expected}
+        with patch("sys.argv", ["bulk-rename", "--folder", str(tmp_path), *extra_args]):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+        assert exc_info.value.code == 0
+        setup.assert_called_once_with(
+            "bulk-rename", verbose=options["verbose"], bulk=options["bulk"])
+        process.assert_called_once_with(str(tmp_path), options["commit"], setup.return_value,
+                                        options["no_convert"], options["cache"])
 
 
 # =============================================================================
 # Edge Cases and Integration Tests
 # =============================================================================
 
+@pytest.mark.slow
 class TestAdditionalCoverage:
     """Tests for additional coverage of edge cases."""
 
-    def test_ffprobe_called_process_error(self, mock_logger, tmp_path):
+    def test_ffprobe_called_process_error(self, mock_logger, mkfile, mocker):
         """Test subprocess.CalledProcessError in ffprobe (lines 265-266)."""
-        test_file = tmp_path / "test.mp4"
-        test_file.write_bytes(b"test")
+        test_file = mkfile("test.mp4", b"test")
 
         # Mock WINDOWS_AVAILABLE and propsys for cross-platform testing
-        with patch("bulk_rename.main.WINDOWS_AVAILABLE", True):
-            with patch("bulk_rename.main.propsys") as mock_propsys_module:
-                mock_propsys_module.SHGetPropertyStoreFromParsingName.side_effect = (
-                    OSError("propsys failed")
-                )
-
-                with patch("bulk_rename.main.pscon") as mock_pscon:
-                    mock_pscon.PKEY_Media_DateEncoded = "mock_key"
+        mocker.patch("bulk_rename.main.WINDOWS_AVAILABLE", True)
+        mock_propsys_module = mocker.patch("bulk_rename.main.propsys")
+        mock_propsys_module.SHGetPropertyStoreFromParsingName.side_effect = (
+            OSError("propsys failed")
+        )
+        mocker.patch("bulk_rename.main.pscon").PKEY_Media_DateEncoded = "mock_key"
+        mocker.patch("bulk_rename.main.subprocess.run",
+                     side_effect=subprocess.CalledProcessError(1, "ffprobe"))
 
-                    with patch("bulk_rename.main.subprocess.run") as mock_run:
-                        mock_run.side_effect = subprocess.CalledProcessError(1, "ffprobe")
-                        result, source = extract_video_timestamp(test_file, mock_logger)
-                        assert isinstance(result, datetime)
-                        assert source == "fallback"
-                        mock_logger.warning.assert_called()
+        result, source = extract_video_timestamp(test_file, mock_logger)
+        assert isinstance(result, datetime)
+        assert source == "fallback"
+        mock_logger.warning.assert_called()
 
-    def test_mov_trash_failure(self, mock_logger, tmp_path):
+    def test_mov_trash_failure(self, mock_logger, mkfile, mocker):
         """Test OSError when trashing MOV file (lines 409-410)."""
-        src = tmp_path / "test.mov"
-        dst = tmp_path / "test.mp4"
-        src.write_bytes(b"mov")
+        src = mkfile("test.mov", b"mov")
+        dst = src.with_suffix(".mp4")
 
         def create_large_dst(*_args, **_kwargs):
             dst.write_bytes(b"x" * 200000)
             return MagicMock(returncode=0)
 
-        with patch("bulk_rename.main.subprocess.run", side_effect=create_large_dst):
-            with patch("bulk_rename.main.send2trash") as mock_trash:
-                mock_trash.side_effect = OSError("trash failed")
-                result = convert_mov_to_mp4(src, commit=True, logger=mock_logger)
-                # Should still return dst path even if trash fails
-                assert result == dst
-                mock_logger.error.assert_called()
+        mocker.patch("bulk_rename.main.subprocess.run", side_effect=create_large_dst)
+        mocker.patch("bulk_rename.main.send2trash", side_effect=OSError("trash failed"))
+
+        # Should still return dst path even if trash fails
+        assert convert_mov_to_mp4(src, commit=True, logger=mock_logger) == dst
+        mock_logger.error.assert_called()
 
-    def test_converted_file_debug_log(self, mock_logger, tmp_path):
+    def test_converted_file_debug_log(self, mock_logger, tmp_path, mkfile):
         """Test debug log for converted files (line 534)."""
-        file1 = tmp_path / "IMG_0001.jpg"
-        file1.write_bytes(b"test")
-
-        metadata = [
-            FileMetadata(
-                original_path=file1,
-                timestamp=datetime(2023, 10, 15, 12, 0, 0, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name="IMG_0001.jpg",
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-                was_converted=True,  # Mark as converted
-            ),
-        ]
+        file1 = mkfile("IMG_0001.jpg", b"test")
+
+        metadata = [_fm(file1, ts=datetime(2023, 10, 15, 12, tzinfo=timezone.utc),
+                        was_converted=True)]
 
-        rename_files(metadata, tmp_path, commit=True, logger=mock_logger)
+        rename_files(metadata, tmp_path, commit=True, logger=mock_logger,
+                     existing_names={"IMG_0001.jpg"})
         # Check that debug was called for converted file
-        debug_calls = [str(c) for c in mock_logger.debug.call_args_list]
-        assert any("Converted file" in c for c in debug_calls)
+        debug_calls = "\n".join(map(str, mock_logger.debug.call_args_list))
+        assert "Converted file" in debug_calls
 
-    def test_unknown_file_type_uses_birthtime(self, mock_logger, tmp_path):
+    def test_unknown_file_type_uses_birthtime(self, mock_logger, mkfile, mocker):
         """Test birthtime path for unknown file types (line 298)."""
         # Create a file with an extension not in IMG_FORMATS or VIDEO_FORMATS
-        test_file = tmp_path / "test.xyz"
-        test_file.write_bytes(b"test")
+        test_file = mkfile("test.xyz", b"test")
 
-        # Create a mock stat_result with st_birthtime
-        mock_stat_result = MagicMock()
-        mock_stat_result.st_birthtime = 1234567890.0
+        # Patch the stat method on pathlib.Path with a stat_result that has st_birthtime
+        mocker.patch.object(Path, 'stat', return_value=MagicMock(st_birthtime=1234567890.0))
 
-        # Patch the stat method on pathlib.Path
-        with patch.object(Path, 'stat', return_value=mock_stat_result):
-            # Call get_media_created_date_time
-            result, source = get_media_created_date_time(test_file, mock_logger)
-            assert isinstance(result, datetime)
-            assert source == "birthtime"
-            # Verify the timestamp matches our mock
-            expected = datetime.fromtimestamp(1234567890.0, tz=timezone.utc)
-            assert result == expected
+        result, source = get_media_created_date_time(test_file, mock_logger)
+        assert source == "birthtime"
+        # Verify the timestamp matches our mock
+        assert result == datetime.fromtimestamp(1234567890.0, tz=timezone.utc)
 
-    def test_unknown_file_type_without_birthtime(self, mock_logger, tmp_path):
+    def test_unknown_file_type_without_birthtime(self, mock_logger, mkfile, mocker):
         """Test fallback when st_birthtime is not available (line 299)."""
         # Create a file with an extension not in IMG_FORMATS or VIDEO_FORMATS
-        test_file = tmp_path / "test.xyz"
-        test_file.write_bytes(b"test")
+        test_file = mkfile("test.xyz", b"test")
 
-        # Mock stat to not have st_birthtime attribute
-        with patch("bulk_rename.main.Path.stat") as mock_stat:
-            # Create a stat_result without st_birthtime
-            mock_stat_result = MagicMock()
-            del mock_stat_result.st_birthtime  # Ensure attribute doesn't exist
-            mock_stat_result.st_mtime = 1234567890.0
-            mock_stat.return_value = mock_stat_result
-
-            # Call get_media_created_date_time
-            result, source = get_media_created_date_time(test_file, mock_logger)
-            assert isinstance(result, datetime)
-            assert source == "fallback"
+        # Create a stat_result without st_birthtime
+        mock_stat_result = MagicMock(st_mtime=1234567890.0)
+        del mock_stat_result.st_birthtime  # Ensure attribute doesn't exist
+        mocker.patch("bulk_rename.main.Path.stat", return_value=mock_stat_result)
+
+        result, source = get_media_created_date_time(test_file, mock_logger)
+        assert isinstance(result, datetime)
+        assert source == "fallback"
+
+
+_PATTERN_CASES = [
+    ("IMG_1234.jpg", True),
+    ("IM_1234.jpg", True),
+    ("IMG_E1234.jpg", True),
+    ("VD_1234.jpg", True),
+    ("1234.jpg", True),
+    ("1234_5678.jpg", True),
+    ("ABCD1234.jpg", True),
+    ("BulkPics 1234.jpg", True),
+    ("PA123456.jpg", True),
+    ("P1234567.jpg", True),
+    ("20231015-0.jpg", True),
+    ("random.jpg", False),
+]
 
 
 class TestEdgeCases:
@@ -1371,42 +2419,17 @@ class TestEdgeCases:
             result = process_folder(str(tmp_path), commit=False, logger=mock_logger)
             assert result == 0
 
-    def test_pattern_matching_all_types(self, mock_logger):
-        patterns = [
-            ("IMG_1234.jpg", True),
-            ("IM_1234.jpg", True),
-            ("IMG_E1234.jpg", True),
-            ("VD_1234.jpg", True),
-            ("1234.jpg", True),
-            ("1234_5678.jpg", True),
-            ("ABCD1234.jpg", True),
-            ("BulkPics 1234.jpg", True),
-            ("PA123456.jpg", True),
-            ("P1234567.jpg", True),
-            ("20231015-0.jpg", True),
-            ("random.jpg", False),
-        ]
-        for filename, should_match in patterns:
-            entry = FileMetadata(
-                original_path=Path(f"/test/{filename}"),
-                timestamp=datetime(2023, 1, 1, tzinfo=timezone.utc),
-                extension=".jpg",
-                original_name=filename,
-                metadata_reliable=True,
-                timestamp_source="EXIF",
-            )
-            _skip, _, reason = should_skip_file(entry, mock_logger)
-            if should_match:
-                assert reason != "pattern", f"{filename} should match a pattern"
-            else:
-                assert reason == "pattern", f"{filename} should not match any pattern"
+    @pytest.mark.parametrize("filename, should_match", _PATTERN_CASES,
+                             ids=[case[0] for case in _PATTERN_CASES])
+    def test_pattern_matching_all_types(self, filename, should_match, mock_logger):
+        _skip, _, reason = should_skip_file(_fm(Path("/test") / filename), mock_logger)
+        assert (reason != "pattern") is should_match
 
-    def test_case_insensitive_suffix(self, mock_logger, tmp_path):
-        file_upper = tmp_path / "test.JPG"
-        file_upper.write_bytes(b"test")
+    def test_case_insensitive_suffix(self, mock_logger, mkfile):
+        file_upper = mkfile("test.JPG", b"test")
 
         with patch("bulk_rename.main.get_media_created_date_time") as mock_get:
-            mock_get.return_value = (datetime.now(timezone.utc), "EXIF")
+            mock_get.return_value = (_NOW, "EXIF")
             result = _extract_single_file_metadata(file_upper, mock_logger)
             assert result is not None
             assert result.extension == ".jpg"